@@ -5,48 +5,86 @@ Checks if the current Python version is compatible
 
 import sys
 
+_BAR = "=" * 60
+
+# Report header; filled in with the running version on each check
+_HEADER = "\n".join((
+    _BAR,
+    "EADA Pro - Python Version Check",
+    _BAR,
+    "\nCurrent Python Version: {version}",
+    "Full Version: {full_version}",
+)) + "\n"
+
+# Verdict text for each outcome, joined once at import time
+_MSG_OK = "\n".join((
+    "\n✅ SUCCESS: Python version is compatible!",
+    "\nYou can proceed with installation:",
+    "  1. Run: .\\setup.ps1 (Windows)",
+    "  2. Or manually: python -m venv venv",
+    "  3. Then: pip install -r requirements.txt",
+)) + "\n"
+
+_MSG_TOO_NEW = "\n".join((
+    "\n❌ ERROR: Python version is TOO NEW",
+    "\nEADA Pro requires Python 3.10 or 3.11",
+    "MediaPipe (face detection library) does not support Python 3.12+",
+    "\nSolutions:",
+    "  1. Install Python 3.10 or 3.11 from python.org",
+    "  2. Use: py -3.10 -m venv venv",
+    "  3. Or: py -3.11 -m venv venv",
+    "\nSee INSTALL.md for detailed instructions",
+)) + "\n"
+
+_MSG_TOO_OLD = "\n".join((
+    "\n⚠️  WARNING: Python version is TOO OLD",
+    "\nEADA Pro requires Python 3.10 or 3.11",
+    "\nPlease upgrade to Python 3.10 or 3.11",
+    "Download from: https://www.python.org/downloads/",
+)) + "\n"
+
+_MSG_UNSUPPORTED = "\n".join((
+    "\n❌ ERROR: Unsupported Python version",
+    "\nEADA Pro requires Python 3.10 or 3.11",
+)) + "\n"
+
+# (message, compatible) keyed on major * 100 + minor
+_MESSAGES = {
+    310: (_MSG_OK, True),
+    311: (_MSG_OK, True),
+}
+
+
+def _verdict(version):
+    """Return the (message, compatible) pair for `version`"""
+    # Compare on the same integer key as _MESSAGES; match/case would be
+    # tidier but this script has to parse on interpreters older than 3.10
+    key = version.major * 100 + version.minor
+    if key in _MESSAGES:
+        return _MESSAGES[key]
+    if 312 <= key < 400:
+        return _MSG_TOO_NEW, False
+    if 300 <= key < 310:
+        return _MSG_TOO_OLD, False
+    return _MSG_UNSUPPORTED, False
+
+
 def check_python_version():
     """Check if Python version is compatible with EADA Pro"""
     version = sys.version_info
-    
-    print("=" * 60)
-    print("EADA Pro - Python Version Check")
-    print("=" * 60)
-    print(f"\nCurrent Python Version: {version.major}.{version.minor}.{version.micro}")
-    print(f"Full Version: {sys.version}")
-    
+
     # Check if version is compatible
-    if version.major == 3 and version.minor in [10, 11]:
-        print("\n✅ SUCCESS: Python version is compatible!")
-        print("\nYou can proceed with installation:")
-        print("  1. Run: .\\setup.ps1 (Windows)")
-        print("  2. Or manually: python -m venv venv")
-        print("  3. Then: pip install -r requirements.txt")
-        return True
-    elif version.major == 3 and version.minor >= 12:
-        print("\n❌ ERROR: Python version is TOO NEW")
-        print("\nEADA Pro requires Python 3.10 or 3.11")
-        print("MediaPipe (face detection library) does not support Python 3.12+")
-        print("\nSolutions:")
-        print("  1. Install Python 3.10 or 3.11 from python.org")
-        print("  2. Use: py -3.10 -m venv venv")
-        print("  3. Or: py -3.11 -m venv venv")
-        print("\nSee INSTALL.md for detailed instructions")
-        return False
-    elif version.major == 3 and version.minor < 10:
-        print("\n⚠️  WARNING: Python version is TOO OLD")
-        print("\nEADA Pro requires Python 3.10 or 3.11")
-        print("\nPlease upgrade to Python 3.10 or 3.11")
-        print("Download from: https://www.python.org/downloads/")
-        return False
-    else:
-        print("\n❌ ERROR: Unsupported Python version")
-        print("\nEADA Pro requires Python 3.10 or 3.11")
-        return False
+    msg, compatible = _verdict(version)
+    sys.stdout.write(_HEADER.format(
+        version=f"{version.major}.{version.minor}.{version.micro}",
+        full_version=sys.version,
+    ) + msg)
+    return compatible
+
 
 if __name__ == "__main__":
     print()
     compatible = check_python_version()
-    print("\n" + "=" * 60)
-    
+    print("\n" + _BAR)
+
     sys.exit(0 if compatible else 1)
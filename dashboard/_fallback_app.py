@@ -0,0 +1,70 @@
+"""
+EADA Pro - Simple Dashboard
+"""
+
+import streamlit as st
+import json
+from pathlib import Path
+from datetime import datetime
+
+st.set_page_config(
+    page_title="EADA Pro Dashboard",
+    page_icon="🚀",
+    layout="wide"
+)
+
+st.title("🚀 EADA Pro Dashboard")
+st.markdown("---")
+
+# Load metrics
+def load_metrics():
+    metrics_file = Path("data/dashboard/metrics.json")
+    if metrics_file.exists():
+        try:
+            with open(metrics_file, 'r') as f:
+                return json.load(f)
+        except:
+            return {}
+    return {}
+
+metrics = load_metrics()
+
+if metrics:
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("👥 Faces", metrics.get('face_count', 0))
+    
+    with col2:
+        st.metric("⚡ FPS", f"{metrics.get('fps', 0):.1f}")
+    
+    with col3:
+        st.metric("☀️ Brightness", f"{metrics.get('brightness', 0)}%")
+    
+    with col4:
+        st.metric("🔊 Volume", f"{int(metrics.get('volume', 0) * 100)}%")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📊 System Info")
+        st.write(f"Distance: {metrics.get('distance', 0):.1f} cm")
+        st.write(f"Gestures: {'✅ Enabled' if metrics.get('gestures_enabled') else '❌ Disabled'}")
+        st.write(f"Media: {'⏸️ Paused' if metrics.get('media_paused') else '▶️ Playing'}")
+    
+    with col2:
+        st.subheader("🎮 Gesture Counts")
+        if 'gesture_counts' in metrics:
+            for gesture, count in metrics['gesture_counts'].items():
+                st.write(f"{gesture}: {count}")
+else:
+    st.info("⏳ Waiting for system data...")
+
+# Auto refresh
+if st.button("🔄 Refresh"):
+    st.rerun()
+
+st.markdown("---")
+st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -5,12 +5,32 @@ Beautiful, modern interface with real-time monitoring
 
 import streamlit as st
 import json
+import re
+import sys
+from collections import deque
 import plotly.graph_objects as go
 import plotly.express as px
+import numpy as np
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 import time
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.core.metrics_channel import open_reader, read_metrics
+from components.dashboard_components import viewport_gate
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+    AUTOREFRESH_AVAILABLE = True
+except ImportError:
+    AUTOREFRESH_AVAILABLE = False
+
 # Page configuration
 st.set_page_config(
     page_title="EADA Pro Dashboard",
@@ -20,7 +40,7 @@ st.set_page_config(
 )
 
 # Custom CSS for beautiful styling
-st.markdown("""
+_CSS = """
 <style>
     /* Main background gradient */
     .stApp {
@@ -39,19 +59,6 @@ st.markdown("""
         text-shadow: 0 0 30px rgba(0, 217, 255, 0.3);
     }
     
-    /* Metric cards */
-    [data-testid="stMetricValue"] {
-        font-size: 2.5rem !important;
-        font-weight: 700 !important;
-        color: #00D9FF !important;
-    }
-    
-    [data-testid="stMetricLabel"] {
-        font-size: 1.1rem !important;
-        color: #B8C5D6 !important;
-        font-weight: 500 !important;
-    }
-    
     /* Card styling */
     .css-1r6slb0 {
         background: linear-gradient(135deg, rgba(26, 38, 64, 0.6) 0%, rgba(15, 27, 53, 0.8) 100%);
@@ -128,25 +135,146 @@ st.markdown("""
         background: linear-gradient(90deg, #FF6B6B 0%, #FF9999 100%);
         color: #FFFFFF;
     }
+    
+    /* Metric card row (rendered as one HTML block) */
+    .metric-row, .status-row {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .status-row {
+        justify-content: space-around;
+    }
+    
+    .metric-card {
+        flex: 1;
+    }
+    
+    .metric-label {
+        font-size: 1.1rem;
+        color: #B8C5D6;
+        font-weight: 500;
+    }
+    
+    .metric-value {
+        font-size: 2.5rem;
+        font-weight: 700;
+        color: #00D9FF;
+    }
+    
+    .metric-delta {
+        display: inline-block;
+        padding: 2px 10px;
+        border-radius: 10px;
+        font-size: 0.9rem;
+    }
+    
+    .metric-delta-good {
+        background: rgba(0, 255, 135, 0.15);
+        color: #00FF87;
+    }
+    
+    .metric-delta-bad {
+        background: rgba(255, 107, 107, 0.15);
+        color: #FF6B6B;
+    }
+    
+    /* Gesture activity log (rendered as one HTML block) */
+    .gesture-row {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .gesture-card {
+        flex: 1;
+        background: linear-gradient(135deg, rgba(0, 217, 255, 0.1) 0%, rgba(123, 47, 255, 0.1) 100%);
+        border: 1px solid rgba(0, 217, 255, 0.3);
+        border-radius: 10px;
+        padding: 20px;
+        text-align: center;
+    }
+    
+    .gesture-card h3 {
+        color: #00D9FF;
+        margin: 0;
+    }
+    
+    .gesture-card p {
+        color: #B8C5D6;
+        margin: 5px 0 0 0;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_data
+def _minify_css(css):
+    """Strip comments and layout whitespace; the block is re-sent every rerun"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+# Streamlit drops any element a rerun does not emit again, so the style block
+# cannot be sent once per session; it is minified (and cached) instead
+st.markdown(_minify_css(_CSS), unsafe_allow_html=True)
 
 # Load metrics function
-@st.cache_data(ttl=1)
-def load_metrics():
-    """Load metrics from JSON file"""
-    metrics_file = Path("data/dashboard/metrics.json")
-    if metrics_file.exists():
-        try:
-            with open(metrics_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
+METRICS_FILE = Path("data/dashboard/metrics.json")
+
+def _mtime():
+    """Modification time of the metrics file in ns, or None if it is missing"""
+    try:
+        return METRICS_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+@st.cache_data(max_entries=4)
+def _load(mtime):
+    """Parse the metrics file; `mtime` is only the cache key, so unchanged
+    files are served from cache without touching the disk. Errors propagate
+    so that a half-written file is not cached."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(METRICS_FILE.read_bytes())
+    with open(METRICS_FILE, 'r') as f:
+        return json.load(f)
+
+# Shared-memory records older than this mean the producer has stopped or
+# restarted under a new block
+SHARED_METRICS_MAX_AGE = 5.0
+
+def _read_shared_metrics():
+    """Latest record from the system manager's shared memory, or None"""
+    shm = st.session_state.get("metrics_shm")
+    if shm is None:
+        shm = open_reader()
+        if shm is None:
             return None
-    return None
+        st.session_state.metrics_shm = shm
+    metrics = read_metrics(shm, max_age=SHARED_METRICS_MAX_AGE)
+    if metrics is None:
+        # Reattach on the next tick in case the producer was restarted
+        del st.session_state["metrics_shm"]
+        shm.close()
+    return metrics
+
+def load_metrics():
+    """Load metrics from shared memory, falling back to the JSON snapshot"""
+    metrics = _read_shared_metrics()
+    if metrics is not None:
+        return metrics
+    mtime = _mtime()
+    if mtime is None:
+        return None
+    try:
+        return _load(mtime)
+    except Exception as e:
+        return None
+
+# Figure skeletons below are built once and cached across reruns; each tick
+# only patches the data fields through the matching _update_* helper.
 
 # Create beautiful gauge chart
-def create_gauge(value, title, max_value=100, color_scheme="cyan"):
-    """Create a beautiful gauge chart"""
+def _gauge_indicator(title, column, max_value=100, color_scheme="cyan"):
+    """Create one beautiful gauge, placed in `column` of the gauge grid"""
     if color_scheme == "cyan":
         colors = ["#00D9FF", "#0099CC", "#006699"]
     elif color_scheme == "purple":
@@ -154,10 +282,10 @@ def create_gauge(value, title, max_value=100, color_scheme="cyan"):
     else:
         colors = ["#00FF87", "#00CC6E", "#009955"]
     
-    fig = go.Figure(go.Indicator(
+    return go.Indicator(
         mode="gauge+number",
-        value=value,
-        domain={'x': [0, 1], 'y': [0, 1]},
+        value=0,
+        domain={'row': 0, 'column': column},
         title={'text': title, 'font': {'size': 20, 'color': '#FFFFFF'}},
         number={'font': {'size': 40, 'color': colors[0]}},
         gauge={
@@ -177,9 +305,19 @@ def create_gauge(value, title, max_value=100, color_scheme="cyan"):
                 'value': max_value * 0.9
             }
         }
-    ))
+    )
+
+@st.cache_resource(max_entries=16)
+def _build_gauges_skeleton():
+    """Brightness, volume and ambient-light gauges side by side in one figure
+    (values filled in by _update_gauges), so the row is a single chart mount"""
+    fig = go.Figure()
+    fig.add_trace(_gauge_indicator("Brightness Level", 0, 100, "cyan"))
+    fig.add_trace(_gauge_indicator("Volume Level", 1, 100, "purple"))
+    fig.add_trace(_gauge_indicator("Ambient Light", 2, 100, "green"))
     
     fig.update_layout(
+        grid={'rows': 1, 'columns': 3, 'pattern': 'independent'},
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         font={'color': "#FFFFFF", 'family': "Arial"},
@@ -189,15 +327,24 @@ def create_gauge(value, title, max_value=100, color_scheme="cyan"):
     
     return fig
 
+def _update_gauges(fig, brightness, volume, ambient_light):
+    """Set the three gauge readings in place"""
+    for trace, value in zip(fig.data, (brightness, volume, ambient_light)):
+        trace.update(value=value)
+    return fig
+
 # Create line chart for real-time data
-def create_line_chart(data_points, title, color="#00D9FF"):
-    """Create beautiful line chart"""
+@st.cache_resource(max_entries=16)
+def _build_line_skeleton(title, color="#00D9FF"):
+    """Create beautiful line chart (points filled in by _update_line)"""
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
-        y=data_points,
+    # WebGL trace: redrawn on the GPU rather than as SVG paths (no spline
+    # smoothing in scattergl, so segments are straight)
+    fig.add_trace(go.Scattergl(
+        y=[],
         mode='lines+markers',
-        line=dict(color=color, width=3, shape='spline'),
+        line=dict(color=color, width=3),
         marker=dict(size=8, color=color, symbol='circle',
                    line=dict(color='#FFFFFF', width=2)),
         fill='tozeroy',
@@ -218,20 +365,41 @@ def create_line_chart(data_points, title, color="#00D9FF"):
     
     return fig
 
+# Samples kept per session for the Performance Monitor charts
+HISTORY_LENGTH = 60
+
+def _push_history(metrics, fps, brightness, volume):
+    """Append the current sample to this session's histories, once per
+    producer update (widget-triggered reruns see the same timestamp)"""
+    for key in ("fps_history", "brightness_history", "volume_history"):
+        st.session_state.setdefault(key, deque(maxlen=HISTORY_LENGTH))
+    timestamp = metrics.get('timestamp')
+    if timestamp is not None and timestamp == st.session_state.get("history_timestamp"):
+        return
+    st.session_state.history_timestamp = timestamp
+    st.session_state.fps_history.append(fps)
+    st.session_state.brightness_history.append(brightness)
+    st.session_state.volume_history.append(volume)
+
+def _update_line(fig, data_points, decimals=0):
+    """Replace the plotted points in place, rounded to `decimals` so the
+    serialized figure stays small (HISTORY_LENGTH bounds the point count)"""
+    y = np.asarray(data_points, dtype=np.float64).round(decimals)
+    if decimals == 0:
+        y = y.astype(np.int64)
+    fig.data[0].update(y=y)
+    return fig
+
 # Create pie chart for gestures
-def create_gesture_pie(gesture_counts):
-    """Create beautiful pie chart for gesture distribution"""
-    if not gesture_counts or sum(gesture_counts.values()) == 0:
-        return None
-    
-    labels = [g.replace('_', ' ').title() for g in gesture_counts.keys()]
-    values = list(gesture_counts.values())
-    
+@st.cache_resource(max_entries=16)
+def _build_pie_skeleton(gestures):
+    """Create beautiful pie chart for gesture distribution; the labels come
+    from the `gestures` tuple once, _update_pie only sets the counts"""
     colors = ['#00D9FF', '#7B2FFF', '#00FF87', '#FF6B9D', '#FFD93D', '#6BCF7F']
     
     fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
+        labels=[g.replace('_', ' ').title() for g in gestures],
+        values=[0] * len(gestures),
         hole=0.4,
         marker=dict(colors=colors, line=dict(color='#0A1628', width=2)),
         textinfo='label+percent',
@@ -256,10 +424,16 @@ def create_gesture_pie(gesture_counts):
     
     return fig
 
+def _update_pie(fig, gesture_counts):
+    """Set the gesture distribution in place"""
+    fig.data[0].values = list(gesture_counts.values())
+    return fig
+
 # Create heatmap
-def create_heatmap(brightness, volume, ambient_light):
-    """Create environment heatmap"""
-    z = [[brightness, volume, ambient_light]]
+@st.cache_resource(max_entries=16)
+def _build_heatmap_skeleton():
+    """Create environment heatmap (levels filled in by _update_heatmap)"""
+    z = [[0, 0, 0]]
     
     fig = go.Figure(data=go.Heatmap(
         z=z,
@@ -292,6 +466,76 @@ def create_heatmap(brightness, volume, ambient_light):
     
     return fig
 
+def _update_heatmap(fig, brightness, volume, ambient_light):
+    """Set the heatmap levels in place"""
+    z = [[brightness, volume, ambient_light]]
+    fig.data[0].update(z=z, text=z)
+    return fig
+
+def _metric_card(label, value, delta=None, good=True):
+    """HTML for one metric card in the top row"""
+    delta_html = ""
+    if delta is not None:
+        delta_html = f"<div class='metric-delta metric-delta-{'good' if good else 'bad'}'>{delta}</div>"
+    return (
+        f"<div class='metric-card'><div class='metric-label'>{label}</div>"
+        f"<div class='metric-value'>{value}</div>{delta_html}</div>"
+    )
+
+def _status_badge(status, text):
+    """HTML for one badge in the status row"""
+    return f"<div class='status-badge status-{status}'>{text}</div>"
+
+def _gesture_card(gesture, count):
+    """HTML for one card in the gesture activity log"""
+    return (
+        f"<div class='gesture-card'><h3>{count}</h3>"
+        f"<p>{gesture.replace('_', ' ').title()}</p></div>"
+    )
+
+def _section_placeholder(height):
+    """Reserve a gated section's height so the page does not collapse under it"""
+    st.markdown(f"<div style='height: {height}px;'></div>", unsafe_allow_html=True)
+
+def _session_figure(key, skeleton):
+    """Return this session's copy of a cached skeleton, stable across reruns
+
+    The skeletons are shared by every browser session, so each session keeps
+    and mutates its own Figure in st.session_state. Together with a fixed
+    st.plotly_chart key, the frontend receives the same chart element each
+    tick and Plotly can diff the changed traces instead of redrawing. A
+    different skeleton for the same key (e.g. new pie labels) starts over.
+    """
+    fig = st.session_state.get(key)
+    skeleton_key = key + "_skeleton"
+    if fig is None or st.session_state.get(skeleton_key) is not skeleton:
+        fig = go.Figure(skeleton)
+        st.session_state[key] = fig
+        st.session_state[skeleton_key] = skeleton
+    return fig
+
+def _patched_figure(key, skeleton, update, *values):
+    """Session figure for `key`, patched through `update` only when `values`
+    differ from the ones it was last patched with (the producer is often
+    slower than the refresh rate, so most ticks change nothing)"""
+    fig = _session_figure(key, skeleton)
+    values_key = key + "_values"
+    if st.session_state.get(values_key) != (id(fig), values):
+        update(fig, *values)
+        st.session_state[values_key] = (id(fig), values)
+    return fig
+
+# Header/footer timestamps, formatted at most once per second / per day
+@st.cache_data(ttl=1)
+def _clock_label():
+    """Sidebar clock; up to a second stale"""
+    return datetime.now().strftime('%H:%M:%S')
+
+@st.cache_data(max_entries=1)
+def _date_label(day):
+    """Footer date for `day`"""
+    return day.strftime('%A, %B %d, %Y')
+
 # Header with animation effect
 st.markdown("""
 <div style='text-align: center; padding: 20px;'>
@@ -325,7 +569,7 @@ with st.sidebar:
     <div style='text-align: center; padding: 10px;'>
         <p style='color: #7B2FFF; font-size: 0.9rem;'>
             Last Updated<br>
-            <strong>{datetime.now().strftime('%H:%M:%S')}</strong>
+            <strong>{_clock_label()}</strong>
         </p>
     </div>
     """, unsafe_allow_html=True)
@@ -334,178 +578,129 @@ with st.sidebar:
 metrics = load_metrics()
 
 if metrics:
-    # Top metrics row
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric(
-            label="👥 Faces Detected",
-            value=metrics.get('face_count', 0),
-            delta=None
-        )
-    
-    with col2:
-        fps = metrics.get('fps', 0)
-        st.metric(
-            label="⚡ FPS",
-            value=f"{fps:.1f}",
-            delta="Good" if fps > 25 else "Low"
-        )
-    
-    with col3:
-        st.metric(
-            label="📏 Distance",
-            value=f"{metrics.get('distance', 0):.0f} cm",
-            delta=None
-        )
-    
-    with col4:
-        brightness = metrics.get('brightness', 0)
-        st.metric(
-            label="☀️ Brightness",
-            value=f"{brightness}%",
-            delta=None
-        )
-    
-    with col5:
-        volume = int(metrics.get('volume', 0) * 100)
-        st.metric(
-            label="🔊 Volume",
-            value=f"{volume}%",
-            delta=None
-        )
+    # Top metrics row, emitted as a single HTML block
+    fps = metrics.get('fps', 0)
+    brightness = metrics.get('brightness', 0)
+    volume = int(metrics.get('volume', 0) * 100)
+    
+    st.markdown(
+        "<div class='metric-row'>"
+        + _metric_card("👥 Faces Detected", metrics.get('face_count', 0))
+        + _metric_card("⚡ FPS", f"{fps:.1f}", "Good" if fps > 25 else "Low", good=fps > 25)
+        + _metric_card("📏 Distance", f"{metrics.get('distance', 0):.0f} cm")
+        + _metric_card("☀️ Brightness", f"{brightness}%")
+        + _metric_card("🔊 Volume", f"{volume}%")
+        + "</div>",
+        unsafe_allow_html=True
+    )
     
     st.markdown("---")
     
-    # Status row
+    # Status row, emitted as a single HTML block
     st.markdown("### 📡 System Status")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        gestures_enabled = metrics.get('gestures_enabled', False)
-        status = "active" if gestures_enabled else "inactive"
-        st.markdown(f"""
-        <div class='status-badge status-{status}'>
-            🎮 Gestures: {'ENABLED' if gestures_enabled else 'DISABLED'}
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        media_paused = metrics.get('media_paused', False)
-        status = "inactive" if media_paused else "active"
-        st.markdown(f"""
-        <div class='status-badge status-{status}'>
-            {'⏸️ Media: PAUSED' if media_paused else '▶️ Media: PLAYING'}
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        current_gesture = metrics.get('current_gesture', 'None')
-        if current_gesture is None:
-            current_gesture = 'None'
-        st.markdown(f"""
-        <div class='status-badge status-active'>
-            ✋ Current: {str(current_gesture).upper()}
-        </div>
-        """, unsafe_allow_html=True)
+    gestures_enabled = metrics.get('gestures_enabled', False)
+    media_paused = metrics.get('media_paused', False)
+    current_gesture = metrics.get('current_gesture', 'None')
+    if current_gesture is None:
+        current_gesture = 'None'
+    
+    st.markdown(
+        "<div class='status-row'>"
+        + _status_badge("active" if gestures_enabled else "inactive",
+                        f"🎮 Gestures: {'ENABLED' if gestures_enabled else 'DISABLED'}")
+        + _status_badge("inactive" if media_paused else "active",
+                        '⏸️ Media: PAUSED' if media_paused else '▶️ Media: PLAYING')
+        + _status_badge("active", f"✋ Current: {str(current_gesture).upper()}")
+        + "</div>",
+        unsafe_allow_html=True
+    )
     
     st.markdown("---")
     
     # Main content area - Gauges
     st.markdown("### 📊 System Metrics")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.plotly_chart(
-            create_gauge(brightness, "Brightness Level", 100, "cyan"),
-            use_container_width=True
-        )
-    
-    with col2:
-        st.plotly_chart(
-            create_gauge(volume, "Volume Level", 100, "purple"),
-            use_container_width=True
-        )
-    
-    with col3:
-        ambient_light = metrics.get('ambient_light', 50)
-        st.plotly_chart(
-            create_gauge(ambient_light, "Ambient Light", 100, "green"),
-            use_container_width=True
-        )
+    ambient_light = metrics.get('ambient_light', 50)
+    st.plotly_chart(
+        _patched_figure("fig_gauges", _build_gauges_skeleton(), _update_gauges, brightness, volume, ambient_light),
+        use_container_width=True,
+        key="gauges"
+    )
     
     st.markdown("---")
     
-    # Charts row
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Gesture pie chart
-        gesture_counts = metrics.get('gesture_counts', {})
-        if gesture_counts and sum(gesture_counts.values()) > 0:
-            fig = create_gesture_pie(gesture_counts)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("🎮 No gesture activity yet. Start using gestures to see distribution!")
-    
-    with col2:
-        # Environment heatmap
-        st.plotly_chart(
-            create_heatmap(brightness, volume, ambient_light),
-            use_container_width=True
-        )
+    # Charts row, rendered once scrolled into view
+    gesture_counts = metrics.get('gesture_counts', {})
+    if viewport_gate("gate_charts"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Gesture pie chart
+            if gesture_counts and sum(gesture_counts.values()) > 0:
+                st.plotly_chart(
+                    _patched_figure("fig_pie_gestures", _build_pie_skeleton(tuple(gesture_counts)), _update_pie, gesture_counts),
+                    use_container_width=True,
+                    key="pie_gestures"
+                )
+            else:
+                st.info("🎮 No gesture activity yet. Start using gestures to see distribution!")
+        
+        with col2:
+            # Environment heatmap
+            st.plotly_chart(
+                _patched_figure("fig_heatmap_environment", _build_heatmap_skeleton(), _update_heatmap, brightness, volume, ambient_light),
+                use_container_width=True,
+                key="heatmap_environment"
+            )
+    else:
+        _section_placeholder(400)
     
     st.markdown("---")
     
     # Gesture counts details
     st.markdown("### 🎮 Gesture Activity Log")
     if gesture_counts and sum(gesture_counts.values()) > 0:
-        cols = st.columns(len(gesture_counts))
-        for idx, (gesture, count) in enumerate(gesture_counts.items()):
-            with cols[idx]:
-                st.markdown(f"""
-                <div style='
-                    background: linear-gradient(135deg, rgba(0, 217, 255, 0.1) 0%, rgba(123, 47, 255, 0.1) 100%);
-                    border: 1px solid rgba(0, 217, 255, 0.3);
-                    border-radius: 10px;
-                    padding: 20px;
-                    text-align: center;
-                '>
-                    <h3 style='color: #00D9FF; margin: 0;'>{count}</h3>
-                    <p style='color: #B8C5D6; margin: 5px 0 0 0;'>{gesture.replace('_', ' ').title()}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        st.markdown(
+            "<div class='gesture-row'>"
+            + "".join(_gesture_card(gesture, count) for gesture, count in gesture_counts.items())
+            + "</div>",
+            unsafe_allow_html=True
+        )
     else:
         st.info("🎮 No gesture data available yet. Start using the system!")
     
     # Live performance metrics
     st.markdown("---")
     st.markdown("### ⚡ Performance Monitor")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        # Create fake history for demo
-        fps_history = [fps] * 20
-        st.plotly_chart(
-            create_line_chart(fps_history, "FPS History", "#00D9FF"),
-            use_container_width=True
-        )
-    
-    with col2:
-        brightness_history = [brightness] * 20
-        st.plotly_chart(
-            create_line_chart(brightness_history, "Brightness History", "#7B2FFF"),
-            use_container_width=True
-        )
-    
-    with col3:
-        volume_history = [volume] * 20
-        st.plotly_chart(
-            create_line_chart(volume_history, "Volume History", "#00FF87"),
-            use_container_width=True
-        )
+    _push_history(metrics, fps, brightness, volume)
+    
+    if viewport_gate("gate_performance"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            fps_history = list(st.session_state.fps_history)
+            st.plotly_chart(
+                _patched_figure("fig_line_fps", _build_line_skeleton("FPS History", "#00D9FF"), _update_line, fps_history, 1),
+                use_container_width=True,
+                key="line_fps"
+            )
+        
+        with col2:
+            brightness_history = list(st.session_state.brightness_history)
+            st.plotly_chart(
+                _patched_figure("fig_line_brightness", _build_line_skeleton("Brightness History", "#7B2FFF"), _update_line, brightness_history, 0),
+                use_container_width=True,
+                key="line_brightness"
+            )
+        
+        with col3:
+            volume_history = list(st.session_state.volume_history)
+            st.plotly_chart(
+                _patched_figure("fig_line_volume", _build_line_skeleton("Volume History", "#00FF87"), _update_line, volume_history, 0),
+                use_container_width=True,
+                key="line_volume"
+            )
+    else:
+        _section_placeholder(300)
 
 else:
     # No data available - show beautiful placeholder
@@ -574,12 +769,16 @@ st.markdown(f"""
         <strong>EADA Pro Dashboard</strong> | Advanced Environment & Device Automation
     </p>
     <p style='font-size: 0.8rem; color: #B8C5D6;'>
-        {datetime.now().strftime('%A, %B %d, %Y')}
+        {_date_label(date.today())}
     </p>
 </div>
 """, unsafe_allow_html=True)
 
-# Auto-refresh logic
+# Auto-refresh logic; the browser-side timer keeps the script thread free
+# so sidebar controls respond immediately between ticks
 if auto_refresh:
-    time.sleep(refresh_rate)
-    st.rerun()
+    if AUTOREFRESH_AVAILABLE:
+        st_autorefresh(interval=refresh_rate * 1000, limit=None, key="eada_refresh")
+    else:
+        time.sleep(refresh_rate)
+        st.rerun()
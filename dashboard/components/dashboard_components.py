@@ -0,0 +1,32 @@
+"""
+EADA Pro - Dashboard Components
+Custom Streamlit components used by dashboard/app.py
+"""
+
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+_viewport_gate = components.declare_component(
+    "viewport_gate",
+    path=str(Path(__file__).parent / "viewport_gate")
+)
+
+
+def viewport_gate(key):
+    """
+    Report whether this point of the page has been scrolled into view
+
+    Place the gate directly above a section and render a fixed-height
+    placeholder instead of the section while it returns False. Once the gate
+    has been visible it stays True for the rest of the session; the browser
+    reruns the script once, when it flips.
+
+    Args:
+        key: Unique element key for this gate
+
+    Returns:
+        True once seen, False until then (including before the browser has
+        reported anything)
+    """
+    return bool(_viewport_gate(key=key, default=False))
@@ -3,9 +3,11 @@ EADA Pro Dashboard Launcher
 Starts both the main system and the Streamlit dashboard in parallel
 """
 
+import multiprocessing.connection
 import subprocess
 import sys
 import os
+import shutil
 import time
 from pathlib import Path
 import signal
@@ -14,6 +16,51 @@ import signal
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Written by the main system once it is up; also read by the simple dashboard
+METRICS_FILE = project_root / "data" / "dashboard" / "metrics.json"
+SYSTEM_READY_TIMEOUT = 15  # seconds
+
+# Copied to dashboard/app.py when the full dashboard is missing
+FALLBACK_DASHBOARD = project_root / "dashboard" / "_fallback_app.py"
+
+
+def _spawn(args):
+    """
+    Start a child in its own process group without inherited handles
+    
+    The group lets stop() signal the child and anything it spawned, and keeps
+    a terminal Ctrl+C from reaching the children behind the launcher's back.
+    On Windows the child stays on the launcher's console: CTRL_BREAK_EVENT
+    only reaches process groups attached to the sender's console.
+    """
+    if sys.platform == 'win32':
+        return subprocess.Popen(args, cwd=project_root, close_fds=True,
+                                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    return subprocess.Popen(args, cwd=project_root, close_fds=True, start_new_session=True)
+
+
+def _stop_process(process, timeout=5):
+    """Interrupt a child's process group, killing it if it does not exit in time"""
+    if process is None or process.poll() is not None:
+        return
+    try:
+        if sys.platform == 'win32':
+            # Delivered as SIGBREAK, which both children turn into their
+            # normal shutdown (src/main.py maps it to KeyboardInterrupt)
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            # Same signal the children used to get from the terminal's Ctrl+C,
+            # so both shut down through their KeyboardInterrupt handlers
+            os.killpg(process.pid, signal.SIGINT)
+        process.wait(timeout=timeout)
+    except Exception:
+        if process.poll() is None:
+            if sys.platform == 'win32':
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+
 
 class DashboardLauncher:
     """Manages launching main system and dashboard"""
@@ -31,15 +78,13 @@ class DashboardLauncher:
         
         # Start main system first
         print("\n📹 Starting main EADA Pro system...")
-        self.system_process = subprocess.Popen(
-            [self.python_exe, "src/main.py"],
-            cwd=project_root,
-            creationflags=subprocess.CREATE_NEW_CONSOLE if sys.platform == 'win32' else 0
-        )
+        launched_at = time.time()
+        self.system_process = _spawn([self.python_exe, "src/main.py"])
         
-        # Wait a bit for system to initialize
-        print("⏳ Waiting for system initialization (3 seconds)...")
-        time.sleep(3)
+        # Wait until the system publishes its first metrics
+        print("⏳ Waiting for system initialization...")
+        if not self._wait_for_system(launched_at):
+            print("⚠️  No metrics yet, starting the dashboard anyway")
         
         # Start Streamlit dashboard
         print("\n📊 Starting Streamlit dashboard...")
@@ -52,146 +97,98 @@ class DashboardLauncher:
             self._create_simple_dashboard()
             dashboard_path = project_root / "dashboard" / "app.py"
         
-        self.dashboard_process = subprocess.Popen(
-            [
-                self.python_exe, "-m", "streamlit", "run",
-                str(dashboard_path),
-                "--server.headless", "true",
-                "--theme.base", "dark",
-                "--theme.primaryColor", "#00D9FF",
-                "--theme.backgroundColor", "#0A1628",
-                "--theme.secondaryBackgroundColor", "#1A2640",
-                "--theme.textColor", "#FFFFFF"
-            ],
-            cwd=project_root
-        )
+        self.dashboard_process = _spawn([
+            self.python_exe, "-m", "streamlit", "run",
+            str(dashboard_path),
+            "--server.headless", "true",
+            "--theme.base", "dark",
+            "--theme.primaryColor", "#00D9FF",
+            "--theme.backgroundColor", "#0A1628",
+            "--theme.secondaryBackgroundColor", "#1A2640",
+            "--theme.textColor", "#FFFFFF"
+        ])
         
         print("\n✅ Both processes started successfully!")
         print("\n" + "=" * 60)
         print("📊 Dashboard URL: http://localhost:8501")
-        print("📹 Main system running in separate console")
+        print("📹 Main system running (errors are shown in this console)")
         print("=" * 60)
         print("\n💡 Press Ctrl+C to stop both processes\n")
         
         # Keep script running and monitor processes
         try:
-            while True:
-                time.sleep(1)
-                
-                # Check if processes are still running
-                if self.system_process.poll() is not None:
-                    print("\n⚠️  Main system process ended")
-                    break
-                    
-                if self.dashboard_process.poll() is not None:
-                    print("\n⚠️  Dashboard process ended")
-                    break
+            # Block until one of them exits instead of polling on a timer
+            self._wait_for_exit()
+            
+            # Check which process ended
+            if self.system_process.poll() is not None:
+                print("\n⚠️  Main system process ended")
+            else:
+                print("\n⚠️  Dashboard process ended")
                     
         except KeyboardInterrupt:
             print("\n\n🛑 Shutting down...")
-            self.stop()
+        
+        # The children run in their own sessions, so nothing else stops them
+        self.stop()
+    
+    def _wait_for_exit(self):
+        """Return once either child process has exited"""
+        processes = (self.system_process, self.dashboard_process)
+        if sys.platform == 'win32':
+            # Wake on either process handle; the timeout only bounds how long
+            # a Ctrl+C in this console waits to be handled
+            handles = [p._handle for p in processes]
+            while not any(p.poll() is not None for p in processes):
+                multiprocessing.connection.wait(handles, timeout=1.0)
+            return
+        
+        while not any(p.poll() is not None for p in processes):
+            try:
+                # Sleep until a child exits; WNOWAIT leaves it for poll() to reap
+                info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+            except ChildProcessError:
+                return
+            if info is not None and info.si_pid not in (p.pid for p in processes):
+                # Not one of ours; reap it so waitid does not keep returning it
+                os.waitpid(info.si_pid, 0)
+    
+    def _wait_for_system(self, launched_at, timeout=SYSTEM_READY_TIMEOUT):
+        """
+        Poll for a metrics file written after `launched_at`
+        
+        Returns:
+            True once the main system has written metrics, False on timeout
+            or if the system process exits first
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if METRICS_FILE.stat().st_mtime >= launched_at:
+                    return True
+            except OSError:
+                pass
+            if self.system_process.poll() is not None:
+                return False
+            time.sleep(0.1)
+        return False
     
     def _create_simple_dashboard(self):
         """Create a simple dashboard if it doesn't exist"""
         dashboard_dir = project_root / "dashboard"
         dashboard_dir.mkdir(exist_ok=True)
         
-        dashboard_content = '''"""
-EADA Pro - Simple Dashboard
-"""
-
-import streamlit as st
-import json
-from pathlib import Path
-from datetime import datetime
-
-st.set_page_config(
-    page_title="EADA Pro Dashboard",
-    page_icon="🚀",
-    layout="wide"
-)
-
-st.title("🚀 EADA Pro Dashboard")
-st.markdown("---")
-
-# Load metrics
-def load_metrics():
-    metrics_file = Path("data/dashboard/metrics.json")
-    if metrics_file.exists():
-        try:
-            with open(metrics_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-metrics = load_metrics()
-
-if metrics:
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("👥 Faces", metrics.get('face_count', 0))
-    
-    with col2:
-        st.metric("⚡ FPS", f"{metrics.get('fps', 0):.1f}")
-    
-    with col3:
-        st.metric("☀️ Brightness", f"{metrics.get('brightness', 0)}%")
-    
-    with col4:
-        st.metric("🔊 Volume", f"{int(metrics.get('volume', 0) * 100)}%")
-    
-    st.markdown("---")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📊 System Info")
-        st.write(f"Distance: {metrics.get('distance', 0):.1f} cm")
-        st.write(f"Gestures: {'✅ Enabled' if metrics.get('gestures_enabled') else '❌ Disabled'}")
-        st.write(f"Media: {'⏸️ Paused' if metrics.get('media_paused') else '▶️ Playing'}")
-    
-    with col2:
-        st.subheader("🎮 Gesture Counts")
-        if 'gesture_counts' in metrics:
-            for gesture, count in metrics['gesture_counts'].items():
-                st.write(f"{gesture}: {count}")
-else:
-    st.info("⏳ Waiting for system data...")
-
-# Auto refresh
-if st.button("🔄 Refresh"):
-    st.rerun()
-
-st.markdown("---")
-st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-'''
-        
-        with open(dashboard_dir / "app.py", 'w', encoding='utf-8') as f:
-            f.write(dashboard_content)
+        shutil.copyfile(FALLBACK_DASHBOARD, dashboard_dir / "app.py")
         
         print("Created simple dashboard")
     
     def stop(self):
         """Stop both processes"""
         print("Stopping dashboard...")
-        if self.dashboard_process:
-            try:
-                self.dashboard_process.terminate()
-                self.dashboard_process.wait(timeout=5)
-            except:
-                if self.dashboard_process.poll() is None:
-                    self.dashboard_process.kill()
+        _stop_process(self.dashboard_process)
         
         print("Stopping main system...")
-        if self.system_process:
-            try:
-                self.system_process.terminate()
-                self.system_process.wait(timeout=5)
-            except:
-                if self.system_process.poll() is None:
-                    self.system_process.kill()
+        _stop_process(self.system_process)
         
         print("✅ All processes stopped")
 
@@ -11,15 +11,32 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 LOGS_DIR = PROJECT_ROOT / "logs"
 
-# Create directories if they don't exist
-DATA_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
+_dirs_ensured = False
+
+
+def ensure_dirs():
+    """
+    Create DATA_DIR and LOGS_DIR if they don't exist
+    
+    Called by whatever is about to write there rather than at import, so
+    merely importing the settings touches no files; repeat calls are free.
+    """
+    global _dirs_ensured
+    if _dirs_ensured:
+        return
+    for directory in (DATA_DIR, LOGS_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+    _dirs_ensured = True
+
 
 # ==================== Camera Settings ====================
 CAMERA_INDEX = 0
 CAMERA_WIDTH = 960  # Reduced from 1280 for better FPS
 CAMERA_HEIGHT = 540  # Reduced from 720 for better FPS
 CAMERA_FPS = 30
+CAMERA_BUFFER_SIZE = 1  # Frames the driver may queue (not honored by every backend)
+CAMERA_MAX_DRAIN = 5  # Max stale frames discarded per read to reach the newest one
+CAMERA_BACKGROUND_CAPTURE = True  # Grab and decode on a background thread, always handing out the newest frame
 
 # ==================== Face Detection Settings ====================
 # Distance estimation parameters
@@ -29,6 +46,9 @@ FOCAL_LENGTH = 700  # Camera focal length (calibrated)
 # Face detection thresholds
 FACE_DETECTION_CONFIDENCE = 0.3  # Lowered for distant face detection
 MIN_FACE_SIZE = 50  # Minimum face size in pixels
+FACE_DETECTION_INTERVAL = 3  # Run detection every Nth frame, reuse the last result in between
+FACE_MOTION_THRESHOLD = 3.0  # Mean gray-level change (0-255) below which a due detection is skipped (0 = off)
+FACE_MOTION_MAX_SKIPS = 1  # Detect anyway after this many motion-gated skips in a row; results are then at most FACE_DETECTION_INTERVAL * (FACE_MOTION_MAX_SKIPS + 1) - 1 frames old (5, ~0.17 s at 30 FPS)
 
 # Distance ranges for adaptation (in cm)
 MIN_DISTANCE_CM = 25  # Minimum distance
@@ -68,6 +88,7 @@ BRIGHTNESS_SMOOTHING = 0.05  # Much lower for faster response to gestures
 
 # Ambient light adaptation
 AMBIENT_LIGHT_SAMPLES = 10  # Number of samples to average
+AMBIENT_LIGHT_THUMBNAIL = (96, 54)  # (width, height) the frame is downsampled to first
 DARK_THRESHOLD = 50  # Brightness level
 BRIGHT_THRESHOLD = 200  # Brightness level
 
@@ -149,7 +170,8 @@ LOG_BACKUP_COUNT = 5
 
 # ==================== Performance Settings ====================
 FRAME_SKIP = 0  # Skip frames for performance (0 = process all)
-PROCESSING_THREADS = 2
+PROCESSING_THREADS = 3  # Face detection, ambient light and audio workers
+OPENCV_THREADS = max(1, (os.cpu_count() or 2) // 2)  # OpenCV's internal pool, sized to leave cores for the workers
 MAX_FPS = 30
 
 # ==================== Display Settings ====================
@@ -157,6 +179,10 @@ SHOW_PREVIEW = True  # Show camera preview window
 SHOW_LANDMARKS = True  # Draw face landmarks
 SHOW_METRICS = True  # Display metrics on preview
 WINDOW_NAME = "EADA Pro - Workspace Optimizer"  # Window title
+DISPLAY_INTERVAL = 1 / 10.0  # seconds between preview refreshes (~10 Hz)
+
+# ==================== Dashboard Settings ====================
+METRICS_SNAPSHOT_INTERVAL = 1.0  # seconds between metrics.json snapshots
 
 # ==================== Feature Flags ====================
 ENABLE_FACE_DETECTION = True
@@ -0,0 +1,151 @@
+"""
+Metrics Channel
+Shared-memory transport for dashboard metrics between the system manager
+and the Streamlit dashboard
+"""
+
+import os
+import struct
+import time
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Optional
+
+SHM_NAME = "eada_metrics"
+
+# Fixed slot order for the gesture counters; must match SystemManager.gesture_counts
+GESTURE_NAMES = (
+    'volume_control',
+    'brightness_control',
+    'play_pause',
+    'next_track',
+    'prev_track',
+)
+MAX_GESTURES = 16
+
+# current_gesture values encoded as a single byte (0 = no gesture yet)
+CURRENT_GESTURES = (None, 'toggle', 'volume', 'brightness', 'play_pause', 'next', 'previous')
+_CURRENT_CODES = {name: code for code, name in enumerate(CURRENT_GESTURES)}
+
+FLAG_GESTURES_ENABLED = 0x01
+FLAG_MEDIA_PAUSED = 0x02
+
+# seq:u32 guards the record below it (odd while a write is in progress)
+_SEQ = struct.Struct("<I")
+# timestamp:f64 face_count:i32 distance:f64 fps:f64 brightness:u8 volume:f64
+# ambient_light:i32 audio_level:f64 flags:u8 current_gesture:u8 gesture_counts:i32[16]
+# (floats stay f64 so values round-trip exactly like the JSON snapshot)
+_LAYOUT = struct.Struct(f"<diddBdidBB{MAX_GESTURES}i")
+SHM_SIZE = _SEQ.size + _LAYOUT.size
+
+_READ_RETRIES = 8
+
+
+class MetricsWriter:
+    """Producer side: owns the shared-memory block and publishes records"""
+
+    def __init__(self, name: str = SHM_NAME):
+        """Create (or take over a stale) shared-memory block"""
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=SHM_SIZE)
+        except FileExistsError:
+            # Left behind by a previous run that did not shut down cleanly
+            self.shm = shared_memory.SharedMemory(name=name)
+            if self.shm.size < SHM_SIZE:
+                self.shm.close()
+                raise
+        self._seq = 0
+        _SEQ.pack_into(self.shm.buf, 0, 0)
+
+    def publish(self, face_count, distance, fps, brightness, volume, ambient_light,
+                audio_level, gestures_enabled, media_paused, current_gesture,
+                gesture_counts):
+        """Write one metrics record"""
+        flags = ((FLAG_GESTURES_ENABLED if gestures_enabled else 0)
+                 | (FLAG_MEDIA_PAUSED if media_paused else 0))
+        counts = [gesture_counts.get(name, 0) for name in GESTURE_NAMES]
+        counts += [0] * (MAX_GESTURES - len(counts))
+
+        buf = self.shm.buf
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq & 0xFFFFFFFF)
+        _LAYOUT.pack_into(
+            buf, _SEQ.size,
+            time.time(), face_count, distance, fps, brightness, volume,
+            ambient_light, audio_level, flags,
+            _CURRENT_CODES.get(current_gesture, 0), *counts
+        )
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq & 0xFFFFFFFF)
+
+    def close(self):
+        """Release and remove the shared-memory block"""
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except (OSError, BufferError):
+            pass
+
+
+def open_reader(name: str = SHM_NAME) -> Optional[shared_memory.SharedMemory]:
+    """Attach to the producer's block, or return None if it is not running"""
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except (FileNotFoundError, OSError):
+        return None
+    if os.name == "posix":
+        # Attaching registers the block with this process's resource tracker,
+        # which would unlink it on exit; the producer owns its lifetime
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    if shm.size < SHM_SIZE:
+        shm.close()
+        return None
+    return shm
+
+
+def read_metrics(shm: shared_memory.SharedMemory,
+                 max_age: Optional[float] = None) -> Optional[dict]:
+    """
+    Read the latest record as the same dict the JSON snapshot carries
+
+    Args:
+        shm: Block returned by open_reader()
+        max_age: Treat records older than this many seconds as missing
+
+    Returns:
+        Metrics dict, or None if nothing (recent) has been published or the
+        producer kept writing through every retry
+    """
+    buf = shm.buf
+    for _ in range(_READ_RETRIES):
+        seq = _SEQ.unpack_from(buf, 0)[0]
+        if seq == 0:
+            return None
+        if seq & 1:
+            continue
+        record = _LAYOUT.unpack_from(buf, _SEQ.size)
+        if _SEQ.unpack_from(buf, 0)[0] == seq:
+            break
+    else:
+        return None
+
+    (timestamp, face_count, distance, fps, brightness, volume, ambient_light,
+     audio_level, flags, current_code) = record[:10]
+    if max_age is not None and time.time() - timestamp > max_age:
+        return None
+    counts = record[10:10 + len(GESTURE_NAMES)]
+    return {
+        'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+        'face_count': face_count,
+        'distance': distance,
+        'fps': fps,
+        'brightness': brightness,
+        'volume': volume,
+        'ambient_light': ambient_light,
+        'audio_level': audio_level,
+        'gestures_enabled': bool(flags & FLAG_GESTURES_ENABLED),
+        'current_gesture': CURRENT_GESTURES[current_code] if current_code < len(CURRENT_GESTURES) else None,
+        'media_paused': bool(flags & FLAG_MEDIA_PAUSED),
+        'gesture_counts': dict(zip(GESTURE_NAMES, counts)),
+    }
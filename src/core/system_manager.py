@@ -8,12 +8,16 @@ import logging
 import time
 import numpy as np
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 from typing import Optional
 from src.config import settings
+from src.core.metrics_channel import MetricsWriter
 from src.modules.perception import (
-    CameraCapture, AudioCapture, FaceDetector, FaceCounter, GestureController
+    CameraCapture, AudioCapture, FaceDetector, FaceCounter
 )
 from src.modules.adaptation import (
     BrightnessController, VolumeController, WeightedAdapter
@@ -24,6 +28,27 @@ from src.modules.intelligence import (
 
 logger = logging.getLogger(__name__)
 
+# Windows virtual-key codes for the media keys, and keybd_event's key-up flag
+VK_MEDIA_NEXT_TRACK = 0xB0
+VK_MEDIA_PREV_TRACK = 0xB1
+VK_MEDIA_PLAY_PAUSE = 0xB3
+KEYEVENTF_KEYUP = 0x0002
+
+# Per-frame sampling runs on a 10-frame cycle: audio and the dashboard
+# metrics once per cycle, ambient light on the phases marked here
+SAMPLING_CYCLE = 10
+AMBIENT_LIGHT_PHASES = (True, False, False, False, False) * 2
+
+
+@dataclass
+class GestureActions:
+    """What this frame's gestures asked for, applied after detection"""
+    volume: Optional[float] = None       # direct volume level (0-100)
+    brightness: Optional[float] = None   # direct brightness level (0-100)
+    play_pause: bool = False
+    next_track: bool = False
+    prev_track: bool = False
+
 
 class SystemManager:
     """Main system manager for EADA Pro"""
@@ -39,7 +64,20 @@ class SystemManager:
         self.audio = AudioCapture()
         self.face_detector = FaceDetector()
         self.face_counter = FaceCounter()
-        self.gesture_controller = GestureController() if settings.ENABLE_GESTURE_RECOGNITION else None
+        self.gesture_controller = None
+        if settings.ENABLE_GESTURE_RECOGNITION:
+            # cvzone/MediaPipe hand tracking is only loaded when gestures are on
+            from src.modules.perception import GestureController
+            self.gesture_controller = GestureController()
+        # gesture_type -> handler recording the gesture into GestureActions
+        self._gesture_handlers = {
+            'toggle_gestures': self._on_toggle_gesture,
+            'volume_control': self._on_volume_gesture,
+            'brightness_control': self._on_brightness_gesture,
+            'play_pause': self._on_play_pause_gesture,
+            'next_track': self._on_next_track_gesture,
+            'prev_track': self._on_prev_track_gesture,
+        }
         
         # Adaptation modules
         self.brightness_controller = BrightnessController()
@@ -53,12 +91,62 @@ class SystemManager:
         # State tracking
         self.is_running = False
         self.frame_count = 0
-        self.last_face_time = time.time()
+        self._phase = 0  # frame_count % SAMPLING_CYCLE, kept without the modulo
+        self.last_face_time = time.perf_counter()
         self.media_paused = False
         
+        # Media keys are sent through user32 directly, resolved once here,
+        # and pressed on their own worker so the frame loop never waits on
+        # the syscall (one worker keeps the presses in order)
+        self._keybd_event = self._load_keybd_event()
+        self._media_keys = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eada-media")
+        
         # Gesture toggle state
         self.gestures_enabled = settings.ENABLE_GESTURE_RECOGNITION
         
+        # Per-frame settings, snapshotted once so the hot path reads locals
+        # instead of module attributes; settings changed after the manager
+        # is created are not picked up
+        self._cfg = SimpleNamespace(
+            enable_face_detection=settings.ENABLE_FACE_DETECTION,
+            frame_interval=1.0 / settings.CAMERA_FPS,
+            enable_face_counting=settings.ENABLE_FACE_COUNTING,
+            enable_ambient_light_detection=settings.ENABLE_AMBIENT_LIGHT_DETECTION,
+            ambient_light_thumbnail=settings.AMBIENT_LIGHT_THUMBNAIL,
+            enable_audio_monitoring=settings.ENABLE_AUDIO_MONITORING,
+            absence_timeout=settings.ABSENCE_TIMEOUT,
+            enable_weighted_adaptation=settings.ENABLE_WEIGHTED_ADAPTATION,
+            max_detection_distance=settings.MAX_DETECTION_DISTANCE,
+            enable_brightness_control=settings.ENABLE_BRIGHTNESS_CONTROL,
+            enable_volume_control=settings.ENABLE_VOLUME_CONTROL,
+            display_interval=settings.DISPLAY_INTERVAL,
+            window_name=settings.WINDOW_NAME,
+            show_landmarks=settings.SHOW_LANDMARKS,
+            enable_gesture_recognition=settings.ENABLE_GESTURE_RECOGNITION,
+            show_metrics=settings.SHOW_METRICS,
+            metrics_snapshot_interval=settings.METRICS_SNAPSHOT_INTERVAL
+        )
+        
+        # Metrics overlay: the static text (title, labels, legend) is
+        # rasterized once into a sprite, only the values are drawn per frame
+        self._overlay_sprite, self._overlay_template = self._build_metric_overlay()
+        brightness_mode = 'Active' if self.brightness_controller.available else 'Simulation'
+        volume_mode = 'Active' if self.volume_controller.available else 'Simulation'
+        # Formatter per value (face count, distance, FPS, brightness, volume,
+        # media state) and the value/line currently shown for each
+        self._overlay_formats = (
+            str,
+            lambda distance: f"{distance:.1f} cm",
+            lambda fps: f"{fps:.1f}",
+            lambda brightness: f"{brightness}% ({brightness_mode})",
+            lambda volume: f"{volume}% ({volume_mode})",
+            lambda paused: 'Paused' if paused else 'Playing',
+        )
+        self._overlay_values = [None] * len(self._overlay_template)
+        self._overlay_lines = [None] * len(self._overlay_template)
+        # Gesture ON/OFF badge, pre-rendered per state
+        self._status_badges = self._build_status_badges()
+        
         # Store frame dimensions for UI elements
         self.frame_width = settings.CAMERA_WIDTH
         self.frame_height = settings.CAMERA_HEIGHT
@@ -66,15 +154,33 @@ class SystemManager:
         # Performance tracking
         self.fps = 0.0
         self.processing_time = 0.0
+        # Processing time summed over the current sampling cycle (fps is
+        # averaged over the cycle rather than taken from a single frame)
+        self._cycle_time = 0.0
+        
+        # Last face detection result and when it was joined, for skipping
+        # detection while the loop runs slower than the camera
+        self._prev_faces = []
+        self._last_detect_time = 0.0
+        
+        # Capture buffer, decoded into again on every frame
+        self._frame_buf = None
+        
+        # Downsampled frame handed to the ambient-light worker, reused each time
+        thumb_width, thumb_height = settings.AMBIENT_LIGHT_THUMBNAIL
+        self._ambient_thumbnail = np.empty((thumb_height, thumb_width, 3), dtype=np.uint8)
+        
+        # Preview refresh is throttled independently of the detection loop
+        self._last_display_t = 0.0
+        self._display_updated = False
+        # Cleared when the user closes the preview window
+        self._preview_open = settings.SHOW_PREVIEW
         
         # Optimization: cached values updated less frequently
         self.cached_ambient_light = None
         self.cached_audio_level = 0.0
         self.cached_background_noise = 0.0
-        
-        # Track last logged gesture values to prevent spam
-        self.last_logged_brightness = None
-        self.last_logged_volume = None
+        self._audio_future = None
         
         # Gesture counting for dashboard
         self.gesture_counts = {
@@ -89,9 +195,26 @@ class SystemManager:
         self.current_gesture = None
         
         # Create data directory for dashboard metrics
+        settings.ensure_dirs()
         self.metrics_dir = Path("data/dashboard")
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
         
+        # Shared-memory channel read by the dashboard every tick; the JSON
+        # file is kept as a low-rate snapshot for other readers
+        try:
+            self.metrics_writer = MetricsWriter()
+        except Exception as e:
+            logger.warning(f"Shared-memory metrics unavailable, using JSON only: {e}")
+            self.metrics_writer = None
+        self.last_metrics_snapshot = 0.0
+        
+        # Workers for face detection and the ambient-light and audio
+        # sampling, all of which run alongside gesture detection
+        self._pool = ThreadPoolExecutor(
+            max_workers=settings.PROCESSING_THREADS,
+            thread_name_prefix="eada-worker"
+        )
+        
         logger.info("System manager initialized successfully")
     
     def start(self) -> bool:
@@ -103,9 +226,14 @@ class SystemManager:
         """
         logger.info("Starting EADA Pro system...")
         
+        # OpenCV parallelizes resize/cvtColor over every core by default,
+        # which oversubscribes the CPU next to the detection workers
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(settings.OPENCV_THREADS)
+        
         # Start camera
         if settings.ENABLE_FACE_DETECTION:
-            if not self.camera.start():
+            if not self.camera.start(background=settings.CAMERA_BACKGROUND_CAPTURE):
                 logger.error("Failed to start camera")
                 return False
         
@@ -116,33 +244,67 @@ class SystemManager:
         
         self.is_running = True
         
-        # Create window for display
-        cv2.namedWindow(settings.WINDOW_NAME)
+        # Create window for display (without a preview there is no window
+        # and no key polling; Ctrl+C stops the loop instead)
+        if settings.SHOW_PREVIEW:
+            cv2.namedWindow(settings.WINDOW_NAME)
         
         logger.info("✓ All systems started successfully")
         return True
     
-    def process_frame(self):
-        """Process a single frame and update all systems"""
-        start_time = time.time()
+    def process_frame(self) -> bool:
+        """
+        Process a single frame and update all systems
         
-        # Read frame
-        ret, frame = self.camera.read_frame()
+        Returns:
+            False if the camera had no frame to process
+        """
+        cfg = self._cfg
+        # One clock read per frame, shared by presence detection, the preview
+        # throttle and the FPS figure. perf_counter is monotonic (wall-clock
+        # changes cannot pause media) and, unlike time.monotonic() on Windows
+        # before Python 3.13, finer than the ~15.6 ms system tick
+        start_time = time.perf_counter()
+        
+        # Read the newest frame (stale buffered frames are dropped) into the
+        # previous frame's buffer: nothing holds on to it past this call
+        ret, frame = self.camera.read_latest_frame(self._frame_buf)
         if not ret or frame is None:
-            return
-        
-        # Detect faces
-        faces = []
-        if settings.ENABLE_FACE_DETECTION:
-            faces = self.face_detector.detect_faces(frame)
+            return False
+        self._frame_buf = frame
+        
+        # Start this frame's environment sampling so it overlaps with detection
+        # (ambient light every 5th frame, audio every 10th to reduce overhead)
+        ambient_future = None
+        phase = self._phase
+        if cfg.enable_ambient_light_detection and AMBIENT_LIGHT_PHASES[phase]:
+            # Mean brightness of a thumbnail is as good as the full frame's.
+            # It is written to a reused buffer that the worker holds until it
+            # is joined later this frame, so drawing on `frame` cannot race it
+            thumbnail = cv2.resize(frame, cfg.ambient_light_thumbnail,
+                                   dst=self._ambient_thumbnail, interpolation=cv2.INTER_AREA)
+            ambient_future = self._pool.submit(self.environment_monitor.estimate_ambient_light, thumbnail)
+        # Audio is analyzed by a worker that publishes the levels itself, so
+        # it is never waited for (nor restarted while the last one still runs)
+        if (cfg.enable_audio_monitoring and phase == 0
+                and (self._audio_future is None or self._audio_future.done())):
+            self._audio_future = self._pool.submit(self._capture_and_analyze_audio)
+        
+        # Detect faces on a worker while gestures are detected on this thread;
+        # neither detector writes to `frame` (hands are drawn later)
+        faces_future = None
+        if cfg.enable_face_detection:
+            # When the last frame overran the camera interval, a detection
+            # joined less than one processing time ago is still current and a
+            # new one would only add latency: reuse its faces this frame
+            runtime_est = self.processing_time
+            if not (runtime_est > cfg.frame_interval
+                    and start_time - self._last_detect_time < runtime_est):
+                faces_future = self._pool.submit(self.face_detector.detect_faces, frame)
         
         # Detect gestures
         gestures = []
-        gesture_adjustment_volume = None
-        gesture_adjustment_brightness = None
-        gesture_play_pause_toggle = False
-        gesture_next_track = False
-        gesture_prev_track = False
+        actions = GestureActions()
         
         # Always detect gestures to allow toggle (fist) even when disabled
         if self.gesture_controller:
@@ -153,46 +315,12 @@ class SystemManager:
             
             # Process gestures directly for continuous controls
             for gesture in gestures:
-                if gesture.gesture_type == 'toggle_gestures':
-                    # Toggle gesture (fist) always works
-                    # The gesture controller toggles its own state, we need to sync
-                    self.gestures_enabled = self.gesture_controller.is_active()
-                    self.current_gesture = 'toggle'
-                
-                elif self.gestures_enabled:
-                    if gesture.gesture_type == 'volume_control' and gesture.value is not None:
-                        gesture_adjustment_volume = gesture.value
-                        self.current_gesture = 'volume'
-                        self.gesture_counts['volume_control'] += 1
-                        # Only log if value changed significantly (>5%)
-                        if self.last_logged_volume is None or abs(gesture_adjustment_volume - self.last_logged_volume) > 5:
-                            self.last_logged_volume = gesture_adjustment_volume
-                        
-                    elif gesture.gesture_type == 'brightness_control' and gesture.value is not None:
-                        gesture_adjustment_brightness = gesture.value
-                        self.current_gesture = 'brightness'
-                        self.gesture_counts['brightness_control'] += 1
-                        # Only log if value changed significantly (>5%)
-                        if self.last_logged_brightness is None or abs(gesture_adjustment_brightness - self.last_logged_brightness) > 5:
-                            self.last_logged_brightness = gesture_adjustment_brightness
-                        
-                    elif gesture.gesture_type == 'play_pause':
-                        gesture_play_pause_toggle = True
-                        self.current_gesture = 'play_pause'
-                        self.gesture_counts['play_pause'] += 1
-                        
-                    elif gesture.gesture_type == 'next_track':
-                        gesture_next_track = True
-                        self.current_gesture = 'next'
-                        self.gesture_counts['next_track'] += 1
-                        
-                    elif gesture.gesture_type == 'prev_track':
-                        gesture_prev_track = True
-                        self.current_gesture = 'previous'
-                        self.gesture_counts['prev_track'] += 1
+                handler = self._gesture_handlers.get(gesture.gesture_type)
+                if handler is not None:
+                    handler(gesture, actions)
         
         # Handle play/pause gesture toggle
-        if gesture_play_pause_toggle:
+        if actions.play_pause:
             if not self.media_paused:
                 logger.info("Gesture: Play/Pause - pausing media")
                 self.media_paused = True
@@ -203,155 +331,220 @@ class SystemManager:
                 self._resume_media()
         
         # Handle next/previous track gestures
-        if gesture_next_track:
+        if actions.next_track:
             logger.info("Gesture: Next Track")
             self._next_track()
-        elif gesture_prev_track:
+        elif actions.prev_track:
             logger.info("Gesture: Previous Track")
             self._prev_track()
         
+        if faces_future is not None:
+            self._prev_faces = faces_future.result()
+            self._last_detect_time = time.perf_counter()
+        faces = self._prev_faces if cfg.enable_face_detection else []
+        n_faces = len(faces)
+        has_faces = n_faces > 0
+        
         # Update face count
-        if settings.ENABLE_FACE_COUNTING:
+        if cfg.enable_face_counting:
             face_count = self.face_counter.update(faces)
         else:
-            face_count = len(faces)
+            face_count = n_faces
         
-        # Monitor environment (every 5th frame to reduce overhead)
-        if self.frame_count % 5 == 0:
-            if settings.ENABLE_AMBIENT_LIGHT_DETECTION:
-                self.cached_ambient_light = self.environment_monitor.estimate_ambient_light(frame)
+        # Monitor environment (sampled above, every 5th frame)
+        if ambient_future is not None:
+            self.cached_ambient_light = ambient_future.result()
         ambient_light = self.cached_ambient_light
         
-        # Analyze audio (every 10th frame to reduce overhead)
-        if self.frame_count % 10 == 0:
-            if settings.ENABLE_AUDIO_MONITORING:
-                audio_data = self.audio.capture_chunk()
-                if audio_data is not None:
-                    audio_analysis = self.audio_analyzer.analyze_audio(audio_data)
-                    self.cached_audio_level = audio_analysis['rms']
-                    self.cached_background_noise = audio_analysis['noise_level']
+        # Latest audio level published by the audio worker
         audio_level = self.cached_audio_level
-        background_noise = self.cached_background_noise
         
         # Presence detection
-        if len(faces) > 0:
-            self.last_face_time = time.time()
+        if has_faces:
+            self.last_face_time = start_time
             if self.media_paused:
                 logger.info("User returned - resuming media")
                 self.media_paused = False
                 self._resume_media()
-        else:
-            # Check if user has been absent
-            absence_duration = time.time() - self.last_face_time
-            if absence_duration > settings.ABSENCE_TIMEOUT and not self.media_paused:
-                logger.info(f"No user detected for {absence_duration:.1f}s - pausing media")
-                self.media_paused = True
-                self._pause_media()
-        
-        # Calculate weighted adaptation values
-        if settings.ENABLE_WEIGHTED_ADAPTATION and len(faces) > 0:
-            adaptation_info = self.weighted_adapter.get_adaptation_info(
-                faces, ambient_light, background_noise
-            )
-            weighted_distance = adaptation_info['weighted_distance']
-        else:
-            # Simple average if no weighted adaptation
-            if len(faces) > 0:
-                weighted_distance = np.mean([f.distance for f in faces])
+        elif not self.media_paused and start_time > self.last_face_time + cfg.absence_timeout:
+            # User has been absent past the timeout (once paused, the absent
+            # path stops at the flag check until someone returns)
+            absence_duration = start_time - self.last_face_time
+            logger.info(f"No user detected for {absence_duration:.1f}s - pausing media")
+            self.media_paused = True
+            self._pause_media()
+        
+        # Adapt to the faces in view; with nobody there only the paused-media
+        # volume needs handling below
+        if has_faces:
+            # Calculate weighted adaptation values
+            if cfg.enable_weighted_adaptation:
+                # Only the weighted distance is used here, so skip the full
+                # get_adaptation_info report (targets and per-face weights)
+                weighted_distance = self.weighted_adapter.calculate_weighted_distance(faces)
             else:
-                weighted_distance = settings.MAX_DETECTION_DISTANCE
+                # Simple average if no weighted adaptation (plain sum: a numpy
+                # round trip costs more than it saves for a handful of faces)
+                weighted_distance = sum(f.distance for f in faces) / n_faces
+            
+            # Apply brightness control - blend distance-based with gesture adjustment
+            if cfg.enable_brightness_control:
+                if actions.brightness is not None:
+                    # Use direct gesture control (value is already 0-100) - no smoothing
+                    self.brightness_controller.set_brightness(int(actions.brightness), smooth=False)
+                else:
+                    # Use distance-based control when no gesture
+                    self.brightness_controller.adapt_to_distance(weighted_distance)
+            
+            # Apply volume control - blend distance-based with gesture adjustment
+            if cfg.enable_volume_control and not self.media_paused:
+                if actions.volume is not None:
+                    # Use direct gesture control (convert 0-100 to 0-1) - no smoothing
+                    gesture_volume = actions.volume / 100.0
+                    self.volume_controller.set_volume(gesture_volume, smooth=False)
+                else:
+                    # Use distance-based control when no gesture
+                    self.volume_controller.adapt_to_distance(weighted_distance)
+        else:
+            weighted_distance = cfg.max_detection_distance
         
-        # Apply brightness control - blend distance-based with gesture adjustment
-        if settings.ENABLE_BRIGHTNESS_CONTROL and len(faces) > 0:
-            if gesture_adjustment_brightness is not None:
-                # Use direct gesture control (value is already 0-100) - no smoothing
-                self.brightness_controller.set_brightness(int(gesture_adjustment_brightness), smooth=False)
-            else:
-                # Use distance-based control when no gesture
-                self.brightness_controller.adapt_to_distance(weighted_distance)
-        
-        # Apply volume control - blend distance-based with gesture adjustment
-        if settings.ENABLE_VOLUME_CONTROL and not self.media_paused and len(faces) > 0:
-            if gesture_adjustment_volume is not None:
-                # Use direct gesture control (convert 0-100 to 0-1) - no smoothing
-                gesture_volume = gesture_adjustment_volume / 100.0
-                self.volume_controller.set_volume(gesture_volume, smooth=False)
-            else:
-                # Use distance-based control when no gesture
-                self.volume_controller.adapt_to_distance(weighted_distance)
-        elif self.media_paused:
+        if self.media_paused:
             self.volume_controller.set_volume(0.0, smooth=False)
         
         # Get current brightness and volume for display
         current_brightness = self.brightness_controller.get_brightness()
         current_volume = self.volume_controller.get_volume()
         
-        # Display preview
-        if settings.SHOW_PREVIEW:
-            display_frame = self._create_display_frame(
-                frame, faces, gestures, face_count, weighted_distance, ambient_light, 
-                audio_level, current_brightness, current_volume
-            )
-            cv2.imshow(settings.WINDOW_NAME, display_frame)
+        # Display preview (at DISPLAY_INTERVAL, not every detection frame)
+        if self._preview_open and start_time - self._last_display_t >= cfg.display_interval:
+            self._last_display_t = start_time
+            # 0 means the user closed the window; backends that cannot report
+            # visibility return -1, and those keep rendering (and 'q' works)
+            if cv2.getWindowProperty(cfg.window_name, cv2.WND_PROP_VISIBLE) == 0:
+                # Closed by the user: imshow would reopen it, so keep running
+                # without rendering a preview nobody is looking at
+                self._preview_open = False
+                logger.info("Preview window closed - continuing without preview (Ctrl+C to quit)")
+            else:
+                display_frame = self._create_display_frame(
+                    frame, faces, gestures, face_count, weighted_distance, ambient_light, 
+                    audio_level, current_brightness, current_volume
+                )
+                cv2.imshow(cfg.window_name, display_frame)
+                self._display_updated = True
         
         # Update performance metrics
-        self.processing_time = time.time() - start_time
-        self.fps = 1.0 / self.processing_time if self.processing_time > 0 else 0
+        self.processing_time = time.perf_counter() - start_time
+        self._cycle_time += self.processing_time
         self.frame_count += 1
+        phase += 1
+        if phase == SAMPLING_CYCLE:
+            phase = 0
+            if self._cycle_time > 0:
+                self.fps = SAMPLING_CYCLE / self._cycle_time
+            self._cycle_time = 0.0
+        self._phase = phase
         
         # Update dashboard metrics every 10 frames
-        if self.frame_count % 10 == 0:
+        if phase == 0:
             self._update_dashboard_metrics(
                 face_count, weighted_distance, ambient_light, audio_level,
                 current_brightness, current_volume
             )
+        
+        return True
+    
+    def _on_toggle_gesture(self, gesture, actions):
+        """Fist: always honoured; the gesture controller toggles its own state, sync it"""
+        self.gestures_enabled = self.gesture_controller.is_active()
+        self.current_gesture = 'toggle'
+    
+    def _on_volume_gesture(self, gesture, actions):
+        """One finger: direct volume level (0-100)"""
+        if not self.gestures_enabled or gesture.value is None:
+            return
+        actions.volume = gesture.value
+        self.current_gesture = 'volume'
+        self.gesture_counts['volume_control'] += 1
+    
+    def _on_brightness_gesture(self, gesture, actions):
+        """Two fingers: direct brightness level (0-100)"""
+        if not self.gestures_enabled or gesture.value is None:
+            return
+        actions.brightness = gesture.value
+        self.current_gesture = 'brightness'
+        self.gesture_counts['brightness_control'] += 1
+    
+    def _on_play_pause_gesture(self, gesture, actions):
+        """Three fingers: toggle playback"""
+        if not self.gestures_enabled:
+            return
+        actions.play_pause = True
+        self.current_gesture = 'play_pause'
+        self.gesture_counts['play_pause'] += 1
+    
+    def _on_next_track_gesture(self, gesture, actions):
+        """Four fingers: next track"""
+        if not self.gestures_enabled:
+            return
+        actions.next_track = True
+        self.current_gesture = 'next'
+        self.gesture_counts['next_track'] += 1
+    
+    def _on_prev_track_gesture(self, gesture, actions):
+        """Five fingers: previous track"""
+        if not self.gestures_enabled:
+            return
+        actions.prev_track = True
+        self.current_gesture = 'previous'
+        self.gesture_counts['prev_track'] += 1
+    
+    def _capture_and_analyze_audio(self):
+        """Analyze the latest audio chunk and publish its levels (runs on the worker pool)"""
+        try:
+            audio_data = self.audio.capture_chunk()
+            if audio_data is None:
+                return
+            audio_analysis = self.audio_analyzer.analyze_audio(audio_data)
+        except Exception as e:
+            logger.error(f"Audio analysis failed: {e}")
+            return
+        self.cached_audio_level = audio_analysis['rms']
+        self.cached_background_noise = audio_analysis['noise_level']
     
     def _create_display_frame(self, frame, faces, gestures, face_count, distance, ambient_light, 
                              audio_level, brightness, volume):
         """Create annotated display frame (optimized)"""
-        # Use reference instead of copy when possible
+        cfg = self._cfg
+        # Annotate the captured frame in place: every read of it (detection,
+        # the ambient-light thumbnail) has happened by now
         display_frame = frame
         
+        # Draw the hands found this frame (skipped during detection so the
+        # face detector worker never sees a half-annotated frame)
+        if self.gesture_controller:
+            display_frame = self.gesture_controller.draw_hands(display_frame)
+        
         # Draw faces (only if landmarks enabled)
-        if faces and settings.SHOW_LANDMARKS:
-            display_frame = self.face_detector.draw_faces(display_frame, faces)
+        if faces and cfg.show_landmarks:
+            display_frame = self.face_detector.draw_faces(display_frame, faces, in_place=True)
         
         # Draw gestures (only if enabled and gestures are on)
-        if gestures and settings.ENABLE_GESTURE_RECOGNITION and settings.SHOW_LANDMARKS and self.gestures_enabled:
+        if gestures and cfg.enable_gesture_recognition and cfg.show_landmarks and self.gestures_enabled:
             display_frame = self.gesture_controller.draw_gesture_info(
                 display_frame, gestures, volume, brightness
             )
         
         # Draw metrics overlay (simplified)
-        if settings.SHOW_METRICS:
+        if cfg.show_metrics:
             # Simplified overlay - no semi-transparent background for better performance
-            y_offset = 30
-            line_height = 30
-            metrics = [
-                f"EADA Pro - Face Tracking System",
-                f"Faces Detected: {face_count}",
-                f"Distance: {distance:.1f} cm",
-                f"FPS: {self.fps:.1f}",
-                f"",
-                f"Brightness: {brightness}% ({'Active' if self.brightness_controller.available else 'Simulation'})",
-                f"Volume: {int(volume * 100)}% ({'Active' if self.volume_controller.available else 'Simulation'})",
-                f"",
-                f"Media: {'Paused' if self.media_paused else 'Playing'}",
-                f"",
-                f"Gestures: 1=Vol 2=Bright 3=Play/Pause 4=Next 5=Prev",
-            ]
-            
-            for i, text in enumerate(metrics):
-                if text == "":
-                    continue
-                color = (0, 255, 0) if i == 0 else (255, 255, 255)
-                font_scale = 0.6 if i == 0 else 0.5
-                thickness = 2 if i == 0 else 1
+            self._blit_overlay_sprite(display_frame)
+            for text, org, scale, color, thickness in self._metric_overlay_lines(
+                    face_count, distance, brightness, volume):
                 cv2.putText(
-                    display_frame, text,
-                    (20, y_offset + i * line_height),
+                    display_frame, text, org,
                     cv2.FONT_HERSHEY_SIMPLEX,
-                    font_scale, color, thickness
+                    scale, color, thickness, cv2.LINE_AA
                 )
         
         # Draw gesture status indicator (top-right corner)
@@ -359,44 +552,124 @@ class SystemManager:
         
         return display_frame
     
+    def _build_metric_overlay(self):
+        """
+        Rasterize the static part of the metrics overlay
+        
+        Returns:
+            ((ys, xs, colors) of the sprite's text pixels, [(origin, font
+            scale, color, thickness) of each value drawn after a label])
+        """
+        y_offset = 30
+        line_height = 30
+        labels = [
+            "EADA Pro - Face Tracking System",
+            "Faces Detected: ",
+            "Distance: ",
+            "FPS: ",
+            "",
+            "Brightness: ",
+            "Volume: ",
+            "",
+            "Media: ",
+            "",
+            "Gestures: 1=Vol 2=Bright 3=Play/Pause 4=Next 5=Prev",
+        ]
+        
+        # BGRA: label color plus glyph coverage as alpha. The text is drawn
+        # with LINE_AA (as are the values on top of it), so its edge pixels
+        # are partial and have to be blended rather than copied
+        sprite = np.zeros((y_offset + len(labels) * line_height, 640, 4), dtype=np.uint8)
+        template = []
+        for i, label in enumerate(labels):
+            if not label:
+                continue
+            org = (20, y_offset + i * line_height)
+            color = (0, 255, 0) if i == 0 else (255, 255, 255)
+            font_scale = 0.6 if i == 0 else 0.5
+            thickness = 2 if i == 0 else 1
+            coverage = np.zeros(sprite.shape[:2], dtype=np.uint8)
+            cv2.putText(coverage, label, org, cv2.FONT_HERSHEY_SIMPLEX,
+                        font_scale, 255, thickness, cv2.LINE_AA)
+            glyphs = coverage > 0
+            sprite[glyphs, :3] = color
+            sprite[glyphs, 3] = coverage[glyphs]
+            if label.endswith(" "):
+                # getTextSize pads the width by the stroke thickness
+                width = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0][0]
+                template.append(((org[0] + width - thickness, org[1]), font_scale, color, thickness))
+        
+        # Keep only the covered pixels, with alpha pre-multiplied into the color
+        ys, xs = np.nonzero(sprite[:, :, 3])
+        alpha = sprite[ys, xs, 3:].astype(np.uint16)
+        color = sprite[ys, xs, :3] * alpha
+        return (ys, xs, alpha, color), template
+    
+    def _blit_overlay_sprite(self, frame):
+        """Alpha-blend the static overlay text onto the frame"""
+        ys, xs, alpha, color = self._overlay_sprite
+        height, width = frame.shape[:2]
+        if ys.size and (ys[-1] >= height or xs.max() >= width):
+            # Preview smaller than the overlay: clip like putText would
+            inside = (ys < height) & (xs < width)
+            ys, xs, alpha, color = ys[inside], xs[inside], alpha[inside], color[inside]
+        background = frame[ys, xs]
+        frame[ys, xs] = (background * (255 - alpha) + color + 127) // 255
+    
+    def _metric_overlay_lines(self, face_count, distance, brightness, volume):
+        """
+        Text and style of each value in the metrics overlay
+        
+        Works as a scoreboard: each value is compared with the one last shown
+        and only re-formatted when it changed (in practice mostly the FPS),
+        at the position from the template built by _build_metric_overlay.
+        """
+        values = (face_count, round(distance, 1), round(self.fps, 1), brightness,
+                  int(volume * 100), self.media_paused)
+        shown = self._overlay_values
+        lines = self._overlay_lines
+        for i, value in enumerate(values):
+            if value != shown[i]:
+                shown[i] = value
+                lines[i] = (self._overlay_formats[i](value),) + self._overlay_template[i]
+        return lines
+    
+    def _build_status_badges(self):
+        """
+        Pre-render the gesture status badge (top-right) for both states
+        
+        Returns:
+            {gestures_enabled: [(sprite, right, top)]} with each box as an
+            opaque BGR sprite and its offset from the right edge and the top
+        """
+        badges = {}
+        for enabled in (True, False):
+            if enabled:
+                lines = [("Gestures: ON", 0.6, 2, (0, 255, 0), 25, 20, 5)]
+            else:
+                lines = [("Gestures: OFF", 0.6, 2, (0, 0, 255), 25, 20, 5),
+                         ("Make FIST to turn ON", 0.5, 1, (255, 255, 0), 50, 18, 3)]
+            boxes = []
+            for text, font_scale, thickness, color, baseline_y, above, below in lines:
+                text_width = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)[0][0]
+                # Black box 5 px around the text, which ends 15 px from the edge
+                sprite = np.zeros((above + below + 1, text_width + 11, 3), dtype=np.uint8)
+                cv2.putText(sprite, text, (5, above), cv2.FONT_HERSHEY_SIMPLEX,
+                            font_scale, color, thickness)
+                boxes.append((sprite, text_width + 20, baseline_y - above))
+            badges[enabled] = boxes
+        return badges
+    
     def _draw_gesture_status(self, frame):
-        """Draw gesture control and cursor control status"""
-        # Status text position (top-right)
-        y_offset = 25
-        
-        # Gesture status
-        if self.gestures_enabled:
-            gesture_text = "Gestures: ON"
-            gesture_color = (0, 255, 0)  # Green
-            gesture_help = None
-        else:
-            gesture_text = "Gestures: OFF"
-            gesture_color = (0, 0, 255)  # Red
-            gesture_help = "Make FIST to turn ON"
-        
-        # Draw gesture status
-        gesture_size = cv2.getTextSize(gesture_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-        gesture_x = frame.shape[1] - gesture_size[0] - 15
-        
-        cv2.rectangle(frame, (gesture_x - 5, y_offset - 20), 
-                     (gesture_x + gesture_size[0] + 5, y_offset + 5), 
-                     (0, 0, 0), -1)
-        
-        cv2.putText(frame, gesture_text, (gesture_x, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, gesture_color, 2)
-        
-        # Draw gesture help text
-        if gesture_help:
-            help_size = cv2.getTextSize(gesture_help, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
-            help_x = frame.shape[1] - help_size[0] - 15
-            help_y = y_offset + 25
-            
-            cv2.rectangle(frame, (help_x - 5, help_y - 18), 
-                         (help_x + help_size[0] + 5, help_y + 3), 
-                         (0, 0, 0), -1)
-            
-            cv2.putText(frame, gesture_help, (help_x, help_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+        """Draw gesture control status (top-right)"""
+        frame_width = frame.shape[1]
+        for sprite, right, top in self._status_badges[self.gestures_enabled]:
+            height, width = sprite.shape[:2]
+            left = frame_width - right
+            if left < 0:
+                # Frame narrower than the badge: clip like cv2 drawing would
+                sprite, width, left = sprite[:, -left:], width + left, 0
+            frame[top:top + height, left:left + width] = sprite[:frame.shape[0] - top]
     
     def run(self):
         """Main system loop"""
@@ -406,15 +679,28 @@ class SystemManager:
         
         logger.info("=" * 60)
         logger.info("EADA Pro is running!")
-        logger.info("Press 'q' to quit")
+        logger.info("Press 'q' to quit" if settings.SHOW_PREVIEW else "Press Ctrl+C to quit")
         logger.info("=" * 60)
         
+        # pollKey (OpenCV >= 4.5.1) services the window without waitKey's 1 ms sleep
+        poll_key = getattr(cv2, 'pollKey', None) or (lambda: cv2.waitKey(1))
+        
         try:
             while self.is_running:
-                self.process_frame()
+                if self.process_frame():
+                    # Check for quit key (only needed after the window was updated)
+                    if not self._display_updated:
+                        continue
+                    self._display_updated = False
+                    key = poll_key()
+                elif settings.SHOW_PREVIEW:
+                    # No camera frame: waitKey's 1 ms sleep keeps the window
+                    # responsive without spinning on the camera
+                    key = cv2.waitKey(1)
+                else:
+                    continue
                 
-                # Check for quit key
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                if key & 0xFF == ord('q'):
                     logger.info("Quit command received")
                     break
                 
@@ -431,85 +717,103 @@ class SystemManager:
         
         self.is_running = False
         
-        # Release resources
-        self.camera.release()
-        self.audio.stop()
-        self.face_detector.release()
+        # Let in-flight sampling finish before its devices are released, and
+        # queued media keys go out
+        self._pool.shutdown(wait=True)
+        self._media_keys.shutdown(wait=True)
+        
+        # Stopping the audio stream and tearing down MediaPipe can each block
+        # for a while and are independent, so they run in the background. The
+        # camera is released here, on the thread that opened it, once its
+        # capture thread has been joined (camera.release does both): the
+        # Windows MSMF/DSHOW backends expect that
+        with ThreadPoolExecutor(max_workers=2) as releaser:
+            releases = [
+                releaser.submit(release)
+                for release in (self.audio.stop, self.face_detector.release)
+            ]
+            self.camera.release()
+        for release in releases:
+            release.result()
         # Gesture controller doesn't need release (no MediaPipe session)
+        if self.metrics_writer is not None:
+            self.metrics_writer.close()
         
         # Close windows
         cv2.destroyAllWindows()
         
         logger.info("System stopped successfully")
     
-    def _pause_media(self):
-        """Pause media playback using Windows media keys"""
+    def _load_keybd_event(self):
+        """Resolve user32's keybd_event once (None where it is unavailable)"""
+        try:
+            import ctypes
+            return ctypes.WinDLL('user32').keybd_event
+        except (AttributeError, OSError):
+            logger.warning("user32 not available - cannot control media")
+            return None
+    
+    def _send_media_key(self, key, action, done_message):
+        """Queue a media key press and release; done_message is logged once sent"""
+        if self._keybd_event is None:
+            return
+        self._media_keys.submit(self._press_media_key, key, action, done_message)
+    
+    def _press_media_key(self, key, action, done_message):
+        """Press and release a media key (runs on the media-key worker)"""
         try:
-            import win32api
-            import win32con
-            # Simulate media play/pause key (VK_MEDIA_PLAY_PAUSE = 0xB3)
-            win32api.keybd_event(0xB3, 0, 0, 0)
-            win32api.keybd_event(0xB3, 0, win32con.KEYEVENTF_KEYUP, 0)
-            logger.info("Media paused")
-        except ImportError:
-            logger.warning("win32api not available - cannot control media")
+            self._keybd_event(key, 0, 0, 0)
+            self._keybd_event(key, 0, KEYEVENTF_KEYUP, 0)
         except Exception as e:
-            logger.error(f"Failed to pause media: {e}")
+            logger.error(f"Failed to {action}: {e}")
+            return
+        logger.info(done_message)
+    
+    def _pause_media(self):
+        """Pause media playback using Windows media keys"""
+        self._send_media_key(VK_MEDIA_PLAY_PAUSE, "pause media", "Media paused")
     
     def _resume_media(self):
         """Resume media playback using Windows media keys"""
-        try:
-            import win32api
-            import win32con
-            # Simulate media play/pause key
-            win32api.keybd_event(0xB3, 0, 0, 0)
-            win32api.keybd_event(0xB3, 0, win32con.KEYEVENTF_KEYUP, 0)
-            logger.info("Media resumed")
-        except ImportError:
-            logger.warning("win32api not available - cannot control media")
-        except Exception as e:
-            logger.error(f"Failed to resume media: {e}")
+        self._send_media_key(VK_MEDIA_PLAY_PAUSE, "resume media", "Media resumed")
     
     def _next_track(self):
         """Skip to next track using Windows media keys"""
-        try:
-            import win32api
-            import win32con
-            # Simulate media next track key (VK_MEDIA_NEXT_TRACK = 0xB0)
-            win32api.keybd_event(0xB0, 0, 0, 0)
-            win32api.keybd_event(0xB0, 0, win32con.KEYEVENTF_KEYUP, 0)
-            logger.info("Next track")
-        except ImportError:
-            logger.warning("win32api not available - cannot control media")
-        except Exception as e:
-            logger.error(f"Failed to skip track: {e}")
+        self._send_media_key(VK_MEDIA_NEXT_TRACK, "skip track", "Next track")
     
     def _prev_track(self):
         """Skip to previous track using Windows media keys"""
-        try:
-            import win32api
-            import win32con
-            # Simulate media previous track key (VK_MEDIA_PREV_TRACK = 0xB1)
-            win32api.keybd_event(0xB1, 0, 0, 0)
-            win32api.keybd_event(0xB1, 0, win32con.KEYEVENTF_KEYUP, 0)
-            logger.info("Previous track")
-        except ImportError:
-            logger.warning("win32api not available - cannot control media")
-        except Exception as e:
-            logger.error(f"Failed to go to previous track: {e}")
+        self._send_media_key(VK_MEDIA_PREV_TRACK, "go to previous track", "Previous track")
     
     def _update_dashboard_metrics(self, face_count, distance, ambient_light, audio_level,
                                    brightness, volume):
-        """Update dashboard metrics JSON file"""
+        """Publish dashboard metrics to shared memory and the JSON snapshot"""
         try:
+            distance = float(distance) if distance is not None else 0.0
+            ambient_light = int(ambient_light) if ambient_light is not None else 50
+            
+            if self.metrics_writer is not None:
+                self.metrics_writer.publish(
+                    face_count, distance, float(self.fps), int(brightness), float(volume),
+                    ambient_light, float(audio_level), self.gestures_enabled,
+                    self.media_paused, self.current_gesture, self.gesture_counts
+                )
+            
+            # JSON snapshot at most once per interval (every update without shared memory)
+            now = time.monotonic()
+            if (self.metrics_writer is not None
+                    and now - self.last_metrics_snapshot < self._cfg.metrics_snapshot_interval):
+                return
+            self.last_metrics_snapshot = now
+            
             metrics = {
                 'timestamp': datetime.now().isoformat(),
                 'face_count': face_count,
-                'distance': float(distance) if distance is not None else 0.0,
+                'distance': distance,
                 'fps': float(self.fps),
                 'brightness': int(brightness),
                 'volume': float(volume),
-                'ambient_light': int(ambient_light) if ambient_light is not None else 50,
+                'ambient_light': ambient_light,
                 'audio_level': float(audio_level),
                 'gestures_enabled': self.gestures_enabled,
                 'current_gesture': self.current_gesture,
@@ -3,7 +3,11 @@ EADA Pro - Main Entry Point
 Edge AI Display Adaptation Professional System
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import signal
 import sys
 from pathlib import Path
 
@@ -16,8 +20,8 @@ from src.core.system_manager import SystemManager
 
 def setup_logging():
     """Configure logging for the application"""
-    # Create logs directory
-    settings.LOGS_DIR.mkdir(exist_ok=True)
+    # Create data and logs directories
+    settings.ensure_dirs()
     
     # Configure file logging (INFO level)
     file_handler = logging.FileHandler(settings.LOG_FILE)
@@ -29,11 +33,18 @@ def setup_logging():
     console_handler.setLevel(logging.ERROR)
     console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     
-    # Set root logger
+    # Set root logger: records are queued and written by a listener thread,
+    # so the frame loop never waits on the log file or the console
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Suppress specific warnings
     logging.getLogger('screen_brightness_control').setLevel(logging.ERROR)
@@ -48,6 +59,12 @@ def setup_logging():
 
 def main():
     """Main entry point"""
+    # run_dashboard.py stops this process with CTRL_BREAK_EVENT on Windows;
+    # take it like Ctrl+C so the run loop shuts down cleanly instead of the
+    # process being ended by the default handler
+    if hasattr(signal, 'SIGBREAK'):
+        signal.signal(signal.SIGBREAK, signal.default_int_handler)
+    
     # Setup logging
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -88,7 +105,10 @@ def main():
         if settings.ENABLE_GESTURE_RECOGNITION:
             print("  • Gestures blend with distance control (30% gesture + 70% auto)")
         print("  • Perfect for crowds settling in!")
-        print("\n⌨️  Press 'q' in the camera window to quit")
+        if settings.SHOW_PREVIEW:
+            print("\n⌨️  Press 'q' in the camera window to quit")
+        else:
+            print("\n⌨️  Press Ctrl+C to quit")
         print("="*60 + "\n")
         
         # Create and run system manager
@@ -4,6 +4,7 @@ Controls screen brightness based on various factors
 """
 
 import logging
+import time
 from typing import Optional
 import numpy as np
 from collections import deque
@@ -104,8 +105,6 @@ class BrightnessController:
         Returns:
             True if successful
         """
-        import time
-        
         # Convert distance to meters for easier comparison
         distance_m = distance / 100.0
         
@@ -114,7 +113,7 @@ class BrightnessController:
             distance_from_last_update = abs(distance_m - self.last_updated_distance)
             if distance_from_last_update < settings.DISTANCE_GRACE_RANGE:
                 # Within grace range - no update needed
-                self.distance_stable_since = time.time()  # Reset timer
+                self.distance_stable_since = time.monotonic()  # Reset timer
                 return True
         
         # Track distance changes for stability detection
@@ -123,14 +122,14 @@ class BrightnessController:
             
             # If distance is changing (not stable), reset timer
             if distance_change >= 0.05:  # 5cm movement threshold for "unstable"
-                self.distance_stable_since = time.time()
+                self.distance_stable_since = time.monotonic()
                 self.last_distance = distance_m
                 logger.debug(f"Distance changing ({distance_change:.2f}m) - waiting for stability")
                 return True
             
             # Distance is stable, check if enough time has passed
             if self.distance_stable_since is not None:
-                time_stable = time.time() - self.distance_stable_since
+                time_stable = time.monotonic() - self.distance_stable_since
                 if time_stable >= settings.STABLE_TIME_THRESHOLD:
                     # Stable for required duration - check if beyond grace range
                     if self.last_updated_distance is None or \
@@ -145,13 +144,13 @@ class BrightnessController:
                     return True
             else:
                 # Start stability timer
-                self.distance_stable_since = time.time()
+                self.distance_stable_since = time.monotonic()
                 self.last_distance = distance_m
                 return True
         else:
             # First measurement - start timer
             logger.info("First distance measurement - starting stability timer")
-            self.distance_stable_since = time.time()
+            self.distance_stable_since = time.monotonic()
             self.last_distance = distance_m
             return True
         
@@ -162,7 +161,7 @@ class BrightnessController:
         # Calculate target brightness using linear interpolation
         # Map distance (25-400cm) to brightness (30-100%)
         distance_normalized = (distance - settings.MIN_DISTANCE_CM) / (settings.MAX_DETECTION_DISTANCE - settings.MIN_DISTANCE_CM)
-        distance_normalized = np.clip(distance_normalized, 0, 1)
+        distance_normalized = max(0.0, min(distance_normalized, 1.0))
         
         target = settings.BRIGHTNESS_CLOSE + (settings.BRIGHTNESS_FAR - settings.BRIGHTNESS_CLOSE) * distance_normalized
         
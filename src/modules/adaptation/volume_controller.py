@@ -4,6 +4,7 @@ Controls system volume based on various factors
 """
 
 import logging
+import time
 import numpy as np
 from typing import Optional
 from collections import deque
@@ -110,8 +111,6 @@ class VolumeController:
         Returns:
             True if successful
         """
-        import time
-        
         # Convert distance to meters for easier comparison
         distance_m = distance / 100.0
         
@@ -120,7 +119,7 @@ class VolumeController:
             distance_from_last_update = abs(distance_m - self.last_updated_distance)
             if distance_from_last_update < settings.DISTANCE_GRACE_RANGE:
                 # Within grace range - no update needed
-                self.distance_stable_since = time.time()  # Reset timer
+                self.distance_stable_since = time.monotonic()  # Reset timer
                 return True
         
         # Track distance changes for stability detection
@@ -129,14 +128,14 @@ class VolumeController:
             
             # If distance is changing (not stable), reset timer
             if distance_change >= 0.05:  # 5cm movement threshold for "unstable"
-                self.distance_stable_since = time.time()
+                self.distance_stable_since = time.monotonic()
                 self.last_distance = distance_m
                 logger.debug(f"Distance changing ({distance_change:.2f}m) - waiting for stability")
                 return True
             
             # Distance is stable, check if enough time has passed
             if self.distance_stable_since is not None:
-                time_stable = time.time() - self.distance_stable_since
+                time_stable = time.monotonic() - self.distance_stable_since
                 if time_stable >= settings.STABLE_TIME_THRESHOLD:
                     # Stable for required duration - check if beyond grace range
                     if self.last_updated_distance is None or \
@@ -151,13 +150,13 @@ class VolumeController:
                     return True
             else:
                 # Start stability timer
-                self.distance_stable_since = time.time()
+                self.distance_stable_since = time.monotonic()
                 self.last_distance = distance_m
                 return True
         else:
             # First measurement - start timer
             logger.info("First distance measurement - starting stability timer")
-            self.distance_stable_since = time.time()
+            self.distance_stable_since = time.monotonic()
             self.last_distance = distance_m
             return True
         
@@ -168,7 +167,7 @@ class VolumeController:
         # Calculate target volume using STEEP curve for pronounced changes
         # Map distance (25-400cm) to volume (20-100%)
         distance_normalized = (distance - settings.MIN_DISTANCE_CM) / (settings.MAX_DETECTION_DISTANCE - settings.MIN_DISTANCE_CM)
-        distance_normalized = np.clip(distance_normalized, 0, 1)
+        distance_normalized = max(0.0, min(distance_normalized, 1.0))
         
         # Apply power curve for extremely steep response: volume = 20 + 80 * (normalized^0.4)
         target_percent = 20 + 80 * (distance_normalized ** settings.VOLUME_DISTANCE_EXPONENT)
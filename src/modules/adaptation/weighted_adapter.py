@@ -4,7 +4,6 @@ Applies weighted adaptation for volume/brightness based on multiple faces
 """
 
 import logging
-import numpy as np
 from typing import List
 from src.modules.perception.face_detector import FaceData
 from src.config import settings
@@ -17,6 +16,10 @@ class WeightedAdapter:
     
     def __init__(self):
         """Initialize weighted adapter"""
+        # Radius of the center region, squared: normalized distances are
+        # scaled by 0.707 (the corner distance), so the comparison can be
+        # done on squared distances without a square root per face
+        self._center_radius_sq = ((1 - settings.CENTER_REGION_RATIO) * 0.707) ** 2
         logger.info("Weighted adapter initialized")
     
     def calculate_distance_weight(self, distance: float) -> float:
@@ -47,15 +50,12 @@ class WeightedAdapter:
         """
         x, y = position
         
-        # Calculate distance from center
-        center_x, center_y = 0.5, 0.5
-        dist_from_center = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-        
-        # Normalize distance (max distance is 0.707 for corners)
-        normalized_dist = dist_from_center / 0.707
+        # Squared distance from center
+        dx = x - 0.5
+        dy = y - 0.5
         
         # Center region gets higher weight
-        if normalized_dist < (1 - settings.CENTER_REGION_RATIO):
+        if dx * dx + dy * dy < self._center_radius_sq:
             return settings.CENTER_WEIGHT
         else:
             return settings.EDGE_WEIGHT
@@ -94,15 +94,29 @@ class WeightedAdapter:
         total_weight = 0.0
         weighted_sum = 0.0
         
+        # Same weights as calculate_face_weight, inlined for the per-frame
+        # path with the thresholds read once instead of once per face
+        near = settings.DISTANCE_THRESHOLD_NEAR
+        near_weight = settings.DISTANCE_WEIGHT_NEAR
+        far_weight = settings.DISTANCE_WEIGHT_FAR
+        center_weight = settings.CENTER_WEIGHT
+        edge_weight = settings.EDGE_WEIGHT
+        center_radius_sq = self._center_radius_sq
+        
         for face in faces:
-            weight = self.calculate_face_weight(face)
-            weighted_sum += face.distance * weight
+            distance = face.distance
+            x, y = face.position
+            dx = x - 0.5
+            dy = y - 0.5
+            weight = ((near_weight if distance < near else far_weight)
+                      * (center_weight if dx * dx + dy * dy < center_radius_sq else edge_weight))
+            weighted_sum += distance * weight
             total_weight += weight
         
         if total_weight > 0:
             return weighted_sum / total_weight
         else:
-            return np.mean([f.distance for f in faces])
+            return sum(f.distance for f in faces) / len(faces)
     
     def calculate_brightness_target(self, faces: List[FaceData], 
                                    ambient_light: float = None) -> int:
@@ -4,6 +4,7 @@ Analyzes audio for background music detection and noise levels
 """
 
 import logging
+import math
 import numpy as np
 from typing import Optional
 from collections import deque
@@ -36,12 +37,13 @@ class AudioAnalyzer:
         if audio_data is None or len(audio_data) == 0:
             return self.get_default_analysis()
         
-        # Calculate RMS (volume level)
-        rms = np.sqrt(np.mean(audio_data ** 2))
+        # Calculate RMS (volume level); vdot sums the squares over all
+        # channels in one pass without a squared copy of the chunk
+        rms = math.sqrt(np.vdot(audio_data, audio_data) / audio_data.size)
         
         # Update noise level history
         self.noise_history.append(rms)
-        self.current_noise_level = np.mean(list(self.noise_history))
+        self.current_noise_level = sum(self.noise_history) / len(self.noise_history)
         
         # Detect background music (simple heuristic)
         # Music typically has consistent energy across time
@@ -36,18 +36,18 @@ class EnvironmentMonitor:
         if frame is None:
             return self.current_ambient_light
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
-        # Calculate mean brightness
-        mean_brightness = np.mean(gray)
+        # Calculate mean brightness in one pass: grayscale is a weighted sum
+        # of B, G and R, so its mean is the same weights applied to the
+        # channel means (without a grayscale image in between)
+        mean_b, mean_g, mean_r, _ = cv2.mean(frame)
+        mean_brightness = 0.114 * mean_b + 0.587 * mean_g + 0.299 * mean_r
         
         # Update history
         self.ambient_light_history.append(mean_brightness)
         
         # Calculate smoothed value
         if len(self.ambient_light_history) > 0:
-            self.current_ambient_light = np.mean(list(self.ambient_light_history))
+            self.current_ambient_light = sum(self.ambient_light_history) / len(self.ambient_light_history)
         
         return self.current_ambient_light
     
@@ -1,8 +1,27 @@
 """Perception modules package"""
-from .camera_capture import CameraCapture
-from .audio_capture import AudioCapture
-from .face_detector import FaceDetector, FaceData
-from .face_counter import FaceCounter
-from .gesture_controller import GestureController, GestureData
+import importlib
 
-__all__ = ['CameraCapture', 'AudioCapture', 'FaceDetector', 'FaceData', 'FaceCounter', 'GestureController', 'GestureData']
+# Submodule defining each public name. Names are imported on first access
+# (PEP 562): SystemManager only imports GestureController when gesture
+# recognition is enabled, and this keeps cvzone and the MediaPipe hands model
+# from loading with the other perception modules when it is not
+_EXPORTS = {
+    'CameraCapture': 'camera_capture',
+    'AudioCapture': 'audio_capture',
+    'FaceDetector': 'face_detector',
+    'FaceData': 'face_detector',
+    'FaceCounter': 'face_counter',
+    'GestureController': 'gesture_controller',
+    'GestureData': 'gesture_controller',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import `name` from its submodule the first time it is accessed"""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
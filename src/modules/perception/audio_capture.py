@@ -7,6 +7,9 @@ import sounddevice as sd
 import numpy as np
 from typing import Optional
 import logging
+import math
+import threading
+import time
 from collections import deque
 from src.config import settings
 
@@ -26,6 +29,13 @@ class AudioCapture:
         self.is_running = False
         self.stream: Optional[sd.InputStream] = None
         
+        # Ring buffer holding the latest chunk, filled by the stream callback
+        self._ring = np.zeros((self.chunk_size, self.channels), dtype=np.float32)
+        self._ring_pos = 0
+        self._samples_written = 0
+        self._samples_read = 0
+        self._ring_lock = threading.Lock()
+        
         # RMS history for smoothing
         self.rms_history = deque(maxlen=10)
         self.current_rms = 0.0
@@ -49,6 +59,16 @@ class AudioCapture:
                 default_device = sd.query_devices(kind='input')
                 logger.info(f"Using default audio device: {default_device['name']}")
             
+            # Record continuously in the background so reads never block
+            self.stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                device=self.device_index,
+                dtype='float32',
+                callback=self._on_audio
+            )
+            self.stream.start()
+            
             self.is_running = True
             logger.info("Audio capture started successfully")
             logger.info(f"Sample rate: {self.sample_rate} Hz")
@@ -59,29 +79,38 @@ class AudioCapture:
             logger.error(f"Error starting audio capture: {e}")
             return False
     
+    def _on_audio(self, indata, frames, time_info, status):
+        """Stream callback: append the recorded block to the ring buffer"""
+        size = self.chunk_size
+        with self._ring_lock:
+            if frames >= size:
+                self._ring[:] = indata[frames - size:]
+                self._ring_pos = 0
+            else:
+                pos = self._ring_pos
+                first = min(frames, size - pos)
+                self._ring[pos:pos + first] = indata[:first]
+                self._ring[:frames - first] = indata[first:]
+                self._ring_pos = (pos + frames) % size
+            self._samples_written += frames
+    
     def capture_chunk(self) -> Optional[np.ndarray]:
         """
-        Capture a single chunk of audio
+        Return the most recent chunk of audio without waiting for the device
         
         Returns:
-            Audio data as numpy array, or None if error
+            Audio data as numpy array (oldest sample first), or None if not
+            running or a full new chunk has not been recorded since the last call
         """
         if not self.is_running:
             return None
         
-        try:
-            audio_data = sd.rec(
-                frames=self.chunk_size,
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                device=self.device_index,
-                blocking=True
-            )
-            return audio_data
-            
-        except Exception as e:
-            logger.error(f"Error capturing audio chunk: {e}")
-            return None
+        with self._ring_lock:
+            if self._samples_written - self._samples_read < self.chunk_size:
+                return None
+            self._samples_read = self._samples_written
+            pos = self._ring_pos
+            return np.concatenate((self._ring[pos:], self._ring[:pos]))
     
     def calculate_rms(self, audio_data: np.ndarray) -> float:
         """
@@ -96,8 +125,8 @@ class AudioCapture:
         if audio_data is None or len(audio_data) == 0:
             return 0.0
         
-        # Calculate RMS
-        rms = np.sqrt(np.mean(audio_data ** 2))
+        # Calculate RMS (sum of squares in one pass, no squared copy)
+        rms = math.sqrt(np.vdot(audio_data, audio_data) / audio_data.size)
         
         # Update history
         self.rms_history.append(rms)
@@ -140,9 +169,11 @@ class AudioCapture:
         num_samples = int(duration * self.sample_rate / self.chunk_size)
         
         for _ in range(num_samples):
+            # Give the stream time to record a fresh chunk
+            time.sleep(self.chunk_size / self.sample_rate)
             audio_data = self.capture_chunk()
             if audio_data is not None:
-                rms = np.sqrt(np.mean(audio_data ** 2))
+                rms = math.sqrt(np.vdot(audio_data, audio_data) / audio_data.size)
                 samples.append(rms)
         
         if samples:
@@ -187,6 +218,7 @@ class AudioCapture:
         if self.stream is not None:
             self.stream.stop()
             self.stream.close()
+            self.stream = None
         logger.info("Audio capture stopped")
     
     def __del__(self):
@@ -7,6 +7,8 @@ import cv2
 import numpy as np
 from typing import Optional, Tuple
 import logging
+import threading
+import time
 from src.config import settings
 
 logger = logging.getLogger(__name__)
@@ -26,11 +28,31 @@ class CameraCapture:
         self.cap: Optional[cv2.VideoCapture] = None
         self.is_running = False
         self.frame_count = 0
+        self.frames_dropped = 0
+        self._dropped_logged = 0
         
-    def start(self) -> bool:
+        # A grab faster than half a frame period was served from the
+        # driver's queue instead of waiting for the sensor
+        self._queued_grab_time = 0.5 / settings.CAMERA_FPS
+        
+        # Background capture: the capture thread leaves the newest decoded
+        # frame in _latest for read_latest_frame, which hands the buffer it
+        # got last time (_delivered) back as _spare to decode into
+        self._capture_thread: Optional[threading.Thread] = None
+        self._frame_ready = threading.Condition()
+        self._latest: Optional[np.ndarray] = None
+        self._delivered: Optional[np.ndarray] = None
+        self._spare: Optional[np.ndarray] = None
+        
+    def start(self, background: bool = False) -> bool:
         """
         Start camera capture
         
+        Args:
+            background: Grab and decode frames on a background thread as the
+                camera delivers them, so read_latest_frame never waits for
+                the sensor while a new frame is already there
+        
         Returns:
             True if successful, False otherwise
         """
@@ -41,12 +63,19 @@ class CameraCapture:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.CAMERA_WIDTH)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.CAMERA_HEIGHT)
             self.cap.set(cv2.CAP_PROP_FPS, settings.CAMERA_FPS)
+            # Keep the driver queue short so frames do not pile up under load
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, settings.CAMERA_BUFFER_SIZE)
             
             if not self.cap.isOpened():
                 logger.error(f"Failed to open camera {self.camera_index}")
                 return False
             
             self.is_running = True
+            if background:
+                self._capture_thread = threading.Thread(
+                    target=self._capture_loop, name="eada-camera", daemon=True
+                )
+                self._capture_thread.start()
             logger.info(f"Camera {self.camera_index} started successfully")
             logger.info(f"Resolution: {settings.CAMERA_WIDTH}x{settings.CAMERA_HEIGHT}")
             logger.info(f"FPS: {settings.CAMERA_FPS}")
@@ -66,6 +95,10 @@ class CameraCapture:
         if not self.is_running or self.cap is None:
             return False, None
         
+        if self._capture_thread is not None:
+            # The capture thread owns the device
+            return self._take_latest_frame(None)
+        
         try:
             ret, frame = self.cap.read()
             if ret:
@@ -79,6 +112,100 @@ class CameraCapture:
             logger.error(f"Error reading frame: {e}")
             return False, None
     
+    def read_latest_frame(self, frame: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Read the newest frame, discarding frames the driver has queued
+        
+        Grabs (without decoding) until a grab has to wait for the sensor,
+        which means the queue is empty and that frame is current, then
+        decodes only that one.
+        
+        Args:
+            frame: Previous frame to decode into instead of allocating a new
+                one (used if its size and type still match)
+        
+        Returns:
+            Tuple of (success, frame) where frame is BGR image
+        """
+        if not self.is_running or self.cap is None:
+            return False, None
+        
+        if self._capture_thread is not None:
+            return self._take_latest_frame(frame)
+        
+        try:
+            stale = -1
+            for _ in range(settings.CAMERA_MAX_DRAIN + 1):
+                started = time.perf_counter()
+                if not self.cap.grab():
+                    break
+                stale += 1
+                if time.perf_counter() - started >= self._queued_grab_time:
+                    break
+            
+            ret, frame = self.cap.retrieve(frame) if stale >= 0 else (False, None)
+            if not ret:
+                logger.warning("Failed to read frame from camera")
+                return False, None
+            
+            self.frames_dropped += stale
+            self._count_frame()
+            return True, frame
+            
+        except Exception as e:
+            logger.error(f"Error reading frame: {e}")
+            return False, None
+    
+    def _capture_loop(self):
+        """Grab and decode frames as the camera delivers them (capture thread)"""
+        spare = None
+        while self.is_running:
+            try:
+                ret = self.cap.grab()
+                if ret:
+                    ret, frame = self.cap.retrieve(spare)
+            except Exception as e:
+                logger.error(f"Error reading frame: {e}")
+                ret = False
+            if not ret:
+                # Camera stalled or gone: retry without spinning on it
+                time.sleep(0.01)
+                continue
+            
+            with self._frame_ready:
+                # A frame nobody took yet is stale now, and its buffer is free;
+                # otherwise decode into the buffer the reader handed back
+                spare = self._latest
+                if spare is not None:
+                    self.frames_dropped += 1
+                else:
+                    spare, self._spare = self._spare, None
+                self._latest = frame
+                self._frame_ready.notify()
+    
+    def _take_latest_frame(self, frame: Optional[np.ndarray]) -> Tuple[bool, Optional[np.ndarray]]:
+        """Take the capture thread's newest frame, waiting up to a second for one"""
+        with self._frame_ready:
+            if frame is not None and frame is self._delivered:
+                self._spare = frame
+                self._delivered = None
+            self._frame_ready.wait_for(lambda: self._latest is not None or not self.is_running,
+                                       timeout=1.0)
+            latest, self._latest = self._latest, None
+            if latest is None:
+                logger.warning("Failed to read frame from camera")
+                return False, None
+            self._delivered = latest
+        self._count_frame()
+        return True, latest
+    
+    def _count_frame(self):
+        """Count a delivered frame, reporting dropped frames every 300 frames"""
+        self.frame_count += 1
+        if self.frame_count % 300 == 0 and self.frames_dropped != self._dropped_logged:
+            logger.info(f"Camera: {self.frames_dropped} stale frames dropped so far")
+            self._dropped_logged = self.frames_dropped
+    
     def get_frame_rgb(self) -> Tuple[bool, Optional[np.ndarray]]:
         """
         Read a frame and convert to RGB
@@ -109,8 +236,20 @@ class CameraCapture:
     def release(self):
         """Release camera resources"""
         if self.cap is not None:
-            self.cap.release()
             self.is_running = False
+            if self._capture_thread is not None:
+                # Wake a waiting reader, and let the thread finish its grab
+                # before the device goes away under it
+                with self._frame_ready:
+                    self._frame_ready.notify_all()
+                self._capture_thread.join(timeout=1.0)
+                if self._capture_thread.is_alive():
+                    # Stuck in the driver: releasing now would pull the
+                    # device out from under it, so leave that to process exit
+                    logger.warning(f"Camera {self.camera_index} capture thread did not stop; not releasing")
+                    return
+                self._capture_thread = None
+            self.cap.release()
             logger.info(f"Camera {self.camera_index} released")
     
     def __del__(self):
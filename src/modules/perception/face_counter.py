@@ -3,7 +3,6 @@ Face Counter Module
 Tracks and counts faces with smoothing and history
 """
 
-import numpy as np
 from typing import List
 from collections import deque
 import logging
@@ -40,7 +39,7 @@ class FaceCounter:
         
         # Calculate smoothed count using moving average
         if len(self.face_count_history) > 0:
-            self.smoothed_count = int(np.round(np.mean(list(self.face_count_history))))
+            self.smoothed_count = round(sum(self.face_count_history) / len(self.face_count_history))
         
         # Update total
         if self.current_count > self.total_faces_detected:
@@ -13,6 +13,9 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Size of the grayscale thumbnail the motion gate compares (16:9)
+MOTION_THUMBNAIL = (80, 45)
+
 
 @dataclass
 class FaceData:
@@ -56,7 +59,14 @@ class FaceDetector:
         self.frame_width = 0
         self.frame_height = 0
         self.frame_count = 0
-        self.skip_mesh_frames = 0  # Counter for skipping expensive Face Mesh processing
+        self.skip_mesh_frames = 0  # Frames left to serve from last_faces before detecting again
+        
+        # Motion gate: thumbnail of the current frame, the one from the last
+        # detection, and detections skipped in a row because nothing moved
+        self._motion_small = np.empty((MOTION_THUMBNAIL[1], MOTION_THUMBNAIL[0], 3), dtype=np.uint8)
+        self._motion_gray = np.empty((MOTION_THUMBNAIL[1], MOTION_THUMBNAIL[0]), dtype=np.uint8)
+        self._detected_gray: Optional[np.ndarray] = None
+        self._motion_skips = 0
         
         logger.info("Face detector initialized")
     
@@ -64,7 +74,12 @@ class FaceDetector:
         """
         Detect faces in frame using optimized two-stage approach:
         1. Face Detection for long-range detection
-        2. Face Mesh on detected regions for accurate distance (every 3rd frame)
+        2. Face Mesh on detected regions for accurate distance
+        
+        Both stages run every FACE_DETECTION_INTERVAL frames; the frames in
+        between reuse the last result (including "no faces"). A due
+        detection is skipped too while the scene has not changed since the
+        last one (see _scene_unchanged).
         
         Args:
             frame: BGR image from camera
@@ -80,12 +95,16 @@ class FaceDetector:
         # Store frame dimensions
         self.frame_height, self.frame_width = frame.shape[:2]
         
-        # If we have faces and it's not time for full detection, return cached faces
-        # This optimization runs full detection every 3 frames, uses tracking for others
-        if self.last_faces and self.skip_mesh_frames > 0:
+        # Not time for full detection yet: reuse the last result
+        if self.skip_mesh_frames > 0:
             self.skip_mesh_frames -= 1
             return self.last_faces
         
+        # Nothing moved since the last detection: its result still stands
+        if self._scene_unchanged(frame):
+            self.skip_mesh_frames = settings.FACE_DETECTION_INTERVAL - 1
+            return self.last_faces
+        
         # Convert to RGB for MediaPipe (do this once)
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
@@ -108,7 +127,7 @@ class FaceDetector:
         # If no faces detected, clear cache and return
         if not detected_bboxes:
             self.last_faces = []
-            self.skip_mesh_frames = 0
+            self.skip_mesh_frames = settings.FACE_DETECTION_INTERVAL - 1
             return []
         
         # Stage 2: Face Mesh on detected regions - Expensive, so skip frames
@@ -141,10 +160,55 @@ class FaceDetector:
                         faces.append(face_data)
         
         self.last_faces = faces
-        # Skip next 2 frames of expensive Face Mesh processing (use cached results)
-        self.skip_mesh_frames = 2
+        # Skip the next frames of expensive processing (use cached results)
+        self.skip_mesh_frames = settings.FACE_DETECTION_INTERVAL - 1
         return faces
     
+    def _scene_unchanged(self, frame: np.ndarray) -> bool:
+        """
+        Check whether frame looks like the frame of the last detection
+        
+        Compares small grayscale thumbnails by mean absolute difference
+        (0-255) against FACE_MOTION_THRESHOLD, over the whole frame and
+        separately over each last detected face box (a small or distant face
+        leaving barely moves the frame-wide mean), and gives up after
+        FACE_MOTION_MAX_SKIPS skips in a row so slow changes are still seen.
+        When it returns False the caller detects on this frame, which
+        becomes the new reference.
+        """
+        threshold = settings.FACE_MOTION_THRESHOLD
+        if threshold <= 0:
+            return False
+        
+        cv2.resize(frame, MOTION_THUMBNAIL, dst=self._motion_small, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(self._motion_small, cv2.COLOR_BGR2GRAY, dst=self._motion_gray)
+        reference = self._detected_gray
+        if (reference is not None and self._motion_skips < settings.FACE_MOTION_MAX_SKIPS
+                and cv2.norm(gray, reference, cv2.NORM_L1) / gray.size < threshold
+                and not any(self._face_region_changed(gray, reference, face.bbox, threshold)
+                            for face in self.last_faces)):
+            self._motion_skips += 1
+            return True
+        
+        # Keep this thumbnail as the reference and reuse the old one's buffer
+        self._motion_skips = 0
+        self._detected_gray = gray
+        self._motion_gray = reference if reference is not None else np.empty_like(gray)
+        return False
+    
+    def _face_region_changed(self, gray: np.ndarray, reference: np.ndarray,
+                             bbox: Tuple[int, int, int, int], threshold: float) -> bool:
+        """Check the mean thumbnail difference inside a face box (frame pixels)"""
+        scale_x = MOTION_THUMBNAIL[0] / self.frame_width
+        scale_y = MOTION_THUMBNAIL[1] / self.frame_height
+        x, y, w, h = bbox
+        x1 = min(max(int(x * scale_x), 0), MOTION_THUMBNAIL[0] - 1)
+        y1 = min(max(int(y * scale_y), 0), MOTION_THUMBNAIL[1] - 1)
+        x2 = max(min(int(np.ceil((x + w) * scale_x)), MOTION_THUMBNAIL[0]), x1 + 1)
+        y2 = max(min(int(np.ceil((y + h) * scale_y)), MOTION_THUMBNAIL[1]), y1 + 1)
+        region = gray[y1:y2, x1:x2]
+        return cv2.norm(region, reference[y1:y2, x1:x2], cv2.NORM_L1) / region.size >= threshold
+    
     def _process_face_mesh_cropped(self, face_landmarks, original_bbox, crop_info) -> Optional[FaceData]:
         """Process Face Mesh landmarks from cropped region"""
         try:
@@ -229,7 +293,7 @@ class FaceDetector:
         if not faces:
             return settings.MAX_DETECTION_DISTANCE
         
-        return np.mean([face.distance for face in faces])
+        return sum(face.distance for face in faces) / len(faces)
     
     def get_closest_face(self, faces: List[FaceData]) -> Optional[FaceData]:
         """Get the closest face to camera"""
@@ -238,18 +302,21 @@ class FaceDetector:
         
         return min(faces, key=lambda f: f.distance)
     
-    def draw_faces(self, frame: np.ndarray, faces: List[FaceData]) -> np.ndarray:
+    def draw_faces(self, frame: np.ndarray, faces: List[FaceData],
+                   in_place: bool = False) -> np.ndarray:
         """
         Draw face bounding boxes and information on frame
         
         Args:
             frame: BGR image
             faces: List of FaceData objects
+            in_place: Draw onto `frame` itself instead of a copy (for callers
+                that no longer need the unannotated frame)
             
         Returns:
             Annotated frame
         """
-        annotated_frame = frame.copy()
+        annotated_frame = frame if in_place else frame.copy()
         
         for i, face in enumerate(faces):
             x, y, w, h = face.bbox
@@ -77,6 +77,9 @@ class GestureController:
         # Track if hand is present
         self.hand_present = False
         
+        # Hands found by the last detect_gestures call, drawn by draw_hands
+        self.last_hands = []
+        
         self.logger.info("Fresh gesture controller initialized")
     
     def _count_fingers(self, hand: dict) -> Tuple[int, List[int]]:
@@ -212,7 +215,7 @@ class GestureController:
         Returns:
             Tuple of (gesture_type, value) where value is for continuous controls
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Special handling for fist gesture (0 fingers) - always check, bypass cooldown check
         if finger_count == 0:
@@ -314,8 +317,10 @@ class GestureController:
         """
         gestures = []
         
-        # Detect hands
-        hands, img = self.detector.findHands(frame, draw=True, flipType=True)
+        # Detect hands without drawing, so `frame` stays unmodified while the
+        # face detector may be reading it on another thread (see draw_hands)
+        hands, img = self.detector.findHands(frame, draw=False, flipType=True)
+        self.last_hands = hands
         
         if not hands:
             # No hand detected - reset movement tracking
@@ -364,9 +369,9 @@ class GestureController:
             finger_count, fingers, x_percent, y_percent, delta_x, delta_y
         )
         
-        # Log detection
+        # Log detection (the message is only built when debug logging is on)
         hand_type = hand.get('type', 'Unknown')
-        if gesture_type:
+        if gesture_type and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
                 f"Hand: {hand_type} | Fingers: {finger_count} {fingers} | "
                 f"Position: ({x_percent:.1f}%, {y_percent:.1f}%) | "
@@ -394,7 +399,7 @@ class GestureController:
             dt: Delta time in seconds (unused, cooldown is time-based)
         """
         if self.in_cooldown:
-            current_time = time.time()
+            current_time = time.monotonic()
             elapsed = current_time - self.cooldown_start_time
             
             if elapsed >= self.cooldown_seconds:
@@ -403,6 +408,30 @@ class GestureController:
                 self.registered_gesture = None
                 self.registered_finger_count = None
     
+    def draw_hands(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Draw the hands found by the last detect_gestures call
+        
+        Same landmarks, box and hand label findHands(draw=True) would draw.
+        
+        Args:
+            frame: Frame that was passed to detect_gestures
+            
+        Returns:
+            Frame with drawn hands
+        """
+        results = getattr(self.detector, 'results', None)
+        if not self.last_hands or results is None or not results.multi_hand_landmarks:
+            return frame
+        
+        for hand, hand_lms in zip(self.last_hands, results.multi_hand_landmarks):
+            self.detector.mpDraw.draw_landmarks(frame, hand_lms, self.detector.mpHands.HAND_CONNECTIONS)
+            x, y, w, h = hand['bbox']
+            cv2.rectangle(frame, (x - 20, y - 20), (x + w + 20, y + h + 20), (255, 0, 255), 2)
+            cv2.putText(frame, hand['type'], (x - 30, y - 30), cv2.FONT_HERSHEY_PLAIN,
+                        2, (255, 0, 255), 2)
+        return frame
+    
     def is_active(self) -> bool:
         """Check if gesture control is active"""
         return self.gesture_active
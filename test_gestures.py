@@ -54,8 +54,10 @@ def test_gesture_recognition():
             # Get smoothed gesture
             smoothed_gesture = gesture_controller.get_smoothed_gesture()
             
-            # Draw gestures
-            display_frame = gesture_controller.draw_hands(frame, gestures)
+            # Draw the tracked hands (detect_gestures no longer draws them)
+            # and the gesture info on top
+            display_frame = gesture_controller.draw_hands(frame)
+            display_frame = gesture_controller.draw_gesture_info(display_frame, gestures)
             
             # Display metrics
             y_offset = 80
@@ -0,0 +1,216 @@
+"""
+EADA Pro - Metrics Channel Test
+Checks the shared-memory record the system manager publishes and the
+dashboard reads (layout, seqlock and stale-block handling)
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+from src.core import metrics_channel
+from src.core.metrics_channel import MetricsWriter, open_reader, read_metrics
+
+# Private block name so a running system's channel is never touched
+TEST_SHM_NAME = f"eada_metrics_test_{os.getpid()}"
+
+# Offsets into the record, after the seq counter
+TIMESTAMP_OFFSET = metrics_channel._SEQ.size
+CURRENT_GESTURE_OFFSET = metrics_channel._SEQ.size + metrics_channel.struct.calcsize("<diddBdidB")
+
+SAMPLE = dict(
+    face_count=2, distance=63.25, fps=27.5, brightness=70, volume=0.45,
+    ambient_light=120, audio_level=0.125, gestures_enabled=True,
+    media_paused=False, current_gesture='volume',
+    gesture_counts={'volume_control': 3, 'play_pause': 1},
+)
+
+
+def _open_reader():
+    """
+    Attach a reader to the test block
+    
+    open_reader drops the block from this process's resource tracker (the
+    dashboard must not unlink the producer's block). Here the writer lives in
+    the same process and unlinks on close, so its registration is restored.
+    """
+    reader = open_reader(TEST_SHM_NAME)
+    if reader is not None and os.name == "posix":
+        from multiprocessing import resource_tracker
+        resource_tracker.register(reader._name, "shared_memory")
+    return reader
+
+
+def _publish_sample(writer):
+    """Publish SAMPLE through `writer`"""
+    writer.publish(**SAMPLE)
+
+
+def test_round_trip():
+    """A published record reads back as the snapshot dict"""
+    logger.info("Testing publish/read round trip...")
+    writer = MetricsWriter(TEST_SHM_NAME)
+    reader = _open_reader()
+    try:
+        _publish_sample(writer)
+        metrics = read_metrics(reader)
+        expected_counts = {name: SAMPLE['gesture_counts'].get(name, 0)
+                           for name in metrics_channel.GESTURE_NAMES}
+        checks = [
+            metrics is not None,
+            metrics['face_count'] == 2,
+            metrics['distance'] == 63.25,
+            metrics['fps'] == 27.5,
+            metrics['brightness'] == 70,
+            metrics['volume'] == 0.45,
+            metrics['ambient_light'] == 120,
+            metrics['audio_level'] == 0.125,
+            metrics['gestures_enabled'] is True,
+            metrics['media_paused'] is False,
+            metrics['current_gesture'] == 'volume',
+            metrics['gesture_counts'] == expected_counts,
+        ]
+        if not all(checks):
+            logger.error(f"✗ Round trip mismatch: {metrics}")
+            return False
+        logger.info("✓ Record round-trips")
+        return True
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_nothing_published():
+    """A fresh block (seq == 0) reads as no metrics, a missing one as no reader"""
+    logger.info("\nTesting empty and missing blocks...")
+    if open_reader(TEST_SHM_NAME) is not None:
+        logger.error("✗ Attached to a block that should not exist")
+        return False
+    writer = MetricsWriter(TEST_SHM_NAME)
+    reader = _open_reader()
+    try:
+        if read_metrics(reader) is not None:
+            logger.error("✗ Fresh block returned metrics")
+            return False
+        logger.info("✓ Missing block and empty record both read as None")
+        return True
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_stale_and_torn_records():
+    """Old records honour max_age; a write in progress is never returned"""
+    logger.info("\nTesting stale and in-progress records...")
+    writer = MetricsWriter(TEST_SHM_NAME)
+    reader = _open_reader()
+    buf = writer.shm.buf
+    try:
+        _publish_sample(writer)
+        # Age the record by ten seconds
+        metrics_channel.struct.pack_into("<d", buf, TIMESTAMP_OFFSET, time.time() - 10)
+        if read_metrics(reader, max_age=5) is not None:
+            logger.error("✗ Stale record returned despite max_age")
+            return False
+        if read_metrics(reader) is None:
+            logger.error("✗ Stale record missing without max_age")
+            return False
+        logger.info("✓ max_age drops stale records")
+        
+        # Unknown gesture code (newer producer) reads as no gesture
+        buf[CURRENT_GESTURE_OFFSET] = 200
+        if read_metrics(reader)['current_gesture'] is not None:
+            logger.error("✗ Unknown gesture code not mapped to None")
+            return False
+        logger.info("✓ Unknown gesture code reads as None")
+        
+        # Odd seq: the producer is mid-write for every retry
+        seq = metrics_channel._SEQ.unpack_from(buf, 0)[0]
+        metrics_channel._SEQ.pack_into(buf, 0, seq + 1)
+        if read_metrics(reader) is not None:
+            logger.error("✗ Record returned while a write was in progress")
+            return False
+        logger.info("✓ In-progress write reads as None")
+        return True
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_stale_block_takeover():
+    """A writer takes over a block left behind by a previous run"""
+    logger.info("\nTesting stale block takeover...")
+    stale = MetricsWriter(TEST_SHM_NAME)
+    _publish_sample(stale)
+    writer = None
+    reader = None
+    try:
+        # Same name still exists: the new writer attaches and resets it
+        writer = MetricsWriter(TEST_SHM_NAME)
+        reader = _open_reader()
+        if read_metrics(reader) is not None:
+            logger.error("✗ Old run's record survived the takeover")
+            return False
+        _publish_sample(writer)
+        metrics = read_metrics(reader)
+        if metrics is None or metrics['face_count'] != SAMPLE['face_count']:
+            logger.error(f"✗ Record after takeover did not read back: {metrics}")
+            return False
+        logger.info("✓ Stale block taken over and reused")
+        return True
+    finally:
+        if reader is not None:
+            reader.close()
+        if writer is not None:
+            writer.close()
+        stale.close()
+
+
+def main():
+    """Run all tests"""
+    logger.info("=" * 60)
+    logger.info("EADA Pro - Metrics Channel Test")
+    logger.info("=" * 60)
+    
+    tests = [
+        ("Round Trip", test_round_trip),
+        ("Empty Block", test_nothing_published),
+        ("Stale/Torn Records", test_stale_and_torn_records),
+        ("Stale Block Takeover", test_stale_block_takeover),
+    ]
+    
+    results = {}
+    for name, test_func in tests:
+        try:
+            results[name] = test_func()
+        except Exception as e:
+            logger.error(f"Test '{name}' crashed: {e}")
+            results[name] = False
+    
+    # Summary
+    logger.info("\n" + "=" * 60)
+    logger.info("Test Summary")
+    logger.info("=" * 60)
+    
+    passed = sum(1 for v in results.values() if v)
+    total = len(results)
+    
+    for name, result in results.items():
+        status = "✓ PASS" if result else "✗ FAIL"
+        logger.info(f"{name:.<40} {status}")
+    
+    logger.info("-" * 60)
+    logger.info(f"Total: {passed}/{total} tests passed")
+    logger.info("=" * 60)
+    
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())